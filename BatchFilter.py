@@ -0,0 +1,174 @@
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory, util
+
+import numpy as np
+
+from FilterEngine import DesignFilter
+from OfflineFilter import DEFAULT_CHUNK_SIZE, filter_file
+
+# Design and shared arrays of the current worker process, set once by init_worker
+_worker = {}
+
+
+def init_worker(compiled, all_pass_chain, shm_names=None, shape=None):
+    """
+    Pool initializer: receive the design once per process instead of once per task.
+
+    For array batches the input and output shared memory blocks are attached
+    here too, so tasks only carry channel indices.
+    """
+    _worker['compiled'] = compiled
+    _worker['all_pass_chain'] = all_pass_chain
+    if shm_names is not None:
+        blocks = [attach_shared_memory(name) for name in shm_names]
+        _worker['blocks'] = blocks
+        _worker['input'] = np.ndarray(shape, dtype=np.float64, buffer=blocks[0].buf)
+        _worker['output'] = np.ndarray(shape, dtype=np.float64, buffer=blocks[1].buf)
+        # Runs as the worker process exits (pool shutdown), before its handles would leak
+        util.Finalize(None, close_worker, exitpriority=10)
+
+
+def attach_shared_memory(name):
+    """
+    Attach to a block the parent created, without registering it for cleanup.
+
+    The parent owns and unlinks the block. Before Python 3.13 attaching also
+    registers the name with the resource tracker, which may then warn about
+    a leak or unlink the block while the parent still uses it, so the
+    registration is skipped (track=False where available).
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    # Unregistering afterwards would also drop the parent's registration when
+    # the tracker process is shared, so suppress the register call instead
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def close_worker():
+    """Release this worker's views and shared memory handles (the parent unlinks the blocks)"""
+    _worker.pop('input', None)
+    _worker.pop('output', None)
+    for block in _worker.pop('blocks', []):
+        block.close()
+
+
+def make_filter(compiled, all_pass_chain):
+    """Fresh DesignFilter with its own copy of the all-pass state"""
+    chain = None
+    if all_pass_chain is not None:
+        chain = copy.deepcopy(all_pass_chain)
+        chain.reset()
+    return DesignFilter(compiled, chain)
+
+
+def filter_channel_range(start, stop):
+    """Worker task: filter rows start..stop of the shared input into the shared output"""
+    design = make_filter(_worker['compiled'], _worker['all_pass_chain'])
+    _worker['output'][start:stop] = design.process_block(_worker['input'][start:stop])
+    return stop - start
+
+
+def filter_file_task(in_path, out_path, chunk_size, column):
+    """Worker task: stream one file through the design"""
+    return filter_file(in_path, out_path,
+                       lambda: make_filter(_worker['compiled'], _worker['all_pass_chain']),
+                       chunk_size=chunk_size, column=column)
+
+
+def channel_ranges(n_channels, n_tasks):
+    """Split channel indices into n_tasks contiguous (start, stop) ranges"""
+    bounds = np.linspace(0, n_channels, n_tasks + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def filter_channels(data, compiled, all_pass_chain=None, workers=None):
+    """
+    Filter every channel of a (channels, samples) array with the same design.
+
+    Channels are split across a process pool. The input is copied once into
+    shared memory and each worker writes its channels straight into a shared
+    output array, so no signal data is pickled. Each worker filters its
+    channels as one (channels, samples) block with the same DesignFilter code
+    as a single-process run, and the filters never mix channels, so the
+    results are identical.
+
+    Args:
+        data (ndarray): Signals, shape (channels, samples) or (samples,)
+        compiled (CompiledFilter): Main filter, None for all-pass only
+        all_pass_chain (AllPassChain): All-pass filters applied after the main filter
+        workers (int): Number of processes (default: one per CPU core);
+            1 filters in the calling process
+
+    Returns:
+        ndarray: Filtered signals with the shape of data
+    """
+    data = np.asarray(data, dtype=np.float64)
+    signals = np.atleast_2d(data)
+    if signals.ndim != 2:
+        raise ValueError(f"Expected a 1-D or 2-D array, got shape {data.shape}")
+    n_channels = signals.shape[0]
+    workers = min(workers or os.cpu_count() or 1, n_channels)
+
+    if workers <= 1 or signals.size == 0:
+        out = make_filter(compiled, all_pass_chain).process_block(signals)
+        return out.reshape(data.shape)
+
+    nbytes = max(signals.nbytes, 1)
+    blocks = [shared_memory.SharedMemory(create=True, size=nbytes) for _ in range(2)]
+    try:
+        shared_in = np.ndarray(signals.shape, dtype=np.float64, buffer=blocks[0].buf)
+        shared_out = np.ndarray(signals.shape, dtype=np.float64, buffer=blocks[1].buf)
+        shared_in[...] = signals
+
+        initargs = (compiled, all_pass_chain, [b.name for b in blocks], signals.shape)
+        with ProcessPoolExecutor(workers, initializer=init_worker, initargs=initargs) as pool:
+            # A few tasks per worker keeps cores busy when channels take uneven time
+            ranges = channel_ranges(n_channels, workers * 4)
+            futures = [pool.submit(filter_channel_range, a, b) for a, b in ranges]
+            for future in futures:
+                future.result()
+
+        out = shared_out.copy()
+        del shared_in, shared_out
+        return out.reshape(data.shape)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def filter_files(in_paths, out_paths, compiled, all_pass_chain=None, workers=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, column=None):
+    """
+    Filter a list of signal files in parallel, one file per task.
+
+    Each file is streamed with OfflineFilter.filter_file inside a worker, so
+    files of any size are handled without loading them whole.
+
+    Returns:
+        list: Number of samples filtered in each file
+    """
+    in_paths = list(in_paths)
+    out_paths = list(out_paths)
+    if len(in_paths) != len(out_paths):
+        raise ValueError("Every input file needs an output file")
+    workers = min(workers or os.cpu_count() or 1, max(len(in_paths), 1))
+
+    if workers <= 1:
+        init_worker(compiled, all_pass_chain)
+        return [filter_file_task(i, o, chunk_size, column) for i, o in zip(in_paths, out_paths)]
+
+    with ProcessPoolExecutor(workers, initializer=init_worker,
+                             initargs=(compiled, all_pass_chain)) as pool:
+        futures = [pool.submit(filter_file_task, i, o, chunk_size, column)
+                   for i, o in zip(in_paths, out_paths)]
+        return [future.result() for future in futures]
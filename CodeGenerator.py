@@ -0,0 +1,127 @@
+"""
+C code generation for filter realizations.
+
+Imported by FilterApp only when "generate C code" is used.
+"""
+
+
+def direct_form_c(coeffs):
+    """Generate Direct Form II implementation"""
+    b = coeffs['b']
+    a = coeffs['a']
+
+    template = [
+        '#include <stdio.h>',
+        '#include <stdlib.h>',
+        '#include <math.h>',
+        '',
+        f'#define NUM_B {len(b)}',
+        f'#define NUM_A {len(a)}',
+        '',
+        'typedef struct {',
+        '    double *state;',
+        '    int state_size;',
+        '} FilterState;',
+        '',
+        f'static const double b[NUM_B] = {{{", ".join([f"{x.real:.10f}" for x in b])}}};\n',
+        f'static const double a[NUM_A] = {{{", ".join([f"{x.real:.10f}" for x in a])}}};\n',
+        '',
+        'FilterState* filter_init(void) {',
+        '    FilterState* f = (FilterState*)malloc(sizeof(FilterState));',
+        '    f->state_size = NUM_A - 1;',
+        '    f->state = (double*)calloc(f->state_size, sizeof(double));',
+        '    return f;',
+        '}',
+        '',
+        'double filter_process(FilterState* f, double x) {',
+        '    double w = x;',
+        '    for(int i = 0; i < f->state_size; i++) {',
+        '        w -= a[i+1] * f->state[i];',
+        '    }',
+        '    double y = b[0] * w;',
+        '    for(int i = 0; i < f->state_size; i++) {',
+        '        y += b[i+1] * f->state[i];',
+        '    }',
+        '    for(int i = f->state_size-1; i > 0; i--) {',
+        '        f->state[i] = f->state[i-1];',
+        '    }',
+        '    f->state[0] = w;',
+        '    return y;',
+        '}',
+        '',
+        'void filter_free(FilterState* f) {',
+        '    free(f->state);',
+        '    free(f);',
+        '}',
+        '',
+        'int main(void) {',
+        '    FilterState* filter = filter_init();',
+        '    double input[10] = {1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0};',
+        '    double output;',
+        '    for(int i = 0; i < 10; i++) {',
+        '        output = filter_process(filter, input[i]);',
+        '        printf("Sample %d: in=%.4f, out=%.4f\\n", i, input[i], output);',
+        '    }',
+        '    filter_free(filter);',
+        '    return 0;',
+        '}'
+    ]
+
+    return '\n'.join(template)
+
+
+def cascade_form_c(coeffs):
+    """Generate Cascade Form implementation"""
+    template = [
+        '#include <stdio.h>',
+        '#include <stdlib.h>',
+        '#include <math.h>',
+        '',
+        f'#define NUM_SECTIONS {len(coeffs)}',
+        '',
+        'typedef struct {',
+        '    double state[NUM_SECTIONS][2];',
+        '} FilterState;',
+        '',
+        'static const double sos[NUM_SECTIONS][6] = {',
+        ',\n'.join([f'    {{ {", ".join(f"{x:.10f}" for x in section)} }}' for section in coeffs]),
+        '};',
+        '',
+        'FilterState* filter_init(void) {',
+        '    FilterState* f = (FilterState*)malloc(sizeof(FilterState));',
+        '    for(int i = 0; i < NUM_SECTIONS; i++) {',
+        '        f->state[i][0] = 0.0;',
+        '        f->state[i][1] = 0.0;',
+        '    }',
+        '    return f;',
+        '}',
+        '',
+        'double filter_process(FilterState* f, double x) {',
+        '    double y = x, w;',
+        '    for(int i = 0; i < NUM_SECTIONS; i++) {',
+        '        w = y - sos[i][4]*f->state[i][0] - sos[i][5]*f->state[i][1];',
+        '        y = sos[i][0]*w + sos[i][1]*f->state[i][0] + sos[i][2]*f->state[i][1];',
+        '        f->state[i][1] = f->state[i][0];',
+        '        f->state[i][0] = w;',
+        '    }',
+        '    return y;',
+        '}',
+        '',
+        'void filter_free(FilterState* f) {',
+        '    free(f);',
+        '}',
+        '',
+        'int main(void) {',
+        '    FilterState* filter = filter_init();',
+        '    double input[10] = {1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0};',
+        '    double output;',
+        '    for(int i = 0; i < 10; i++) {',
+        '        output = filter_process(filter, input[i]);',
+        '        printf("Sample %d: in=%.4f, out=%.4f\\n", i, input[i], output);',
+        '    }',
+        '    filter_free(filter);',
+        '    return 0;',
+        '}'
+    ]
+
+    return '\n'.join(template)
@@ -0,0 +1,177 @@
+import threading
+
+import numpy as np
+
+from FilterEngine import FilterEngine, AllPassChain
+from Instrumentation import Instrumentation
+
+
+class SPSCQueue:
+    """
+    Lock-free single-producer/single-consumer queue of blocks.
+
+    A fixed ring of slots where only the producer advances tail and only the
+    consumer advances head. Each index is written by one thread, and slot and
+    index assignments are atomic in CPython, so no lock is needed as long as
+    there is exactly one producer and one consumer.
+    """
+    def __init__(self, capacity=256):
+        self.slots = [None] * capacity
+        self.capacity = capacity
+        self.head = 0  # Next slot to read (consumer only)
+        self.tail = 0  # Next slot to write (producer only)
+        self.dropped = 0  # Blocks rejected because the queue was full
+
+    def push(self, item):
+        """Producer side: add an item, returning False if the queue is full"""
+        if self.tail - self.head >= self.capacity:
+            self.dropped += 1
+            return False
+        self.slots[self.tail % self.capacity] = item
+        self.tail += 1  # Publish only after the slot is written
+        return True
+
+    def pop(self):
+        """Consumer side: take the oldest item, or None if the queue is empty"""
+        if self.head == self.tail:
+            return None
+        idx = self.head % self.capacity
+        item = self.slots[idx]
+        self.slots[idx] = None
+        self.head += 1
+        return item
+
+    def __len__(self):
+        return self.tail - self.head
+
+
+class DSPWorker(threading.Thread):
+    """
+    Background thread that owns the real-time filter state.
+
+    The GUI thread submits input blocks and collects output blocks through two
+    SPSCQueues. sosfilt/lfilter release the GIL while filtering, so heavy
+    designs do not stall the GUI. Designs are hot-swapped by replacing a single
+    reference, which the worker picks up between blocks, so a block is never
+    filtered with half-updated coefficients. Blocks may be 1-D or
+    (channels, samples) for multichannel streams such as stereo or sensor
+    arrays; every channel keeps its own filter state.
+
+    Blocks travel through the queues tagged with the reset count they were
+    submitted under. After reset(), blocks submitted before it are dropped
+    unfiltered and output filtered before it is never returned by collect(),
+    without the GUI thread ever popping the worker's input queue.
+
+    Attributes:
+        input_queue, output_queue (SPSCQueue): Block handoff to and from the GUI
+        engine (FilterEngine): Main filter state, only touched by the worker
+        all_pass_chain (AllPassChain): All-pass state, only touched by the worker
+        instrumentation (Instrumentation): Receives 'filter' and 'all_pass' spans
+    """
+    def __init__(self, queue_capacity=256, instrumentation=None):
+        super().__init__(name="DSPWorker", daemon=True)
+        self.input_queue = SPSCQueue(queue_capacity)
+        self.output_queue = SPSCQueue(queue_capacity)
+        self.engine = FilterEngine()
+        self.all_pass_chain = AllPassChain()
+        self.compiled = None
+        self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+
+        # Written only by the GUI thread; the worker compares them with what it applied
+        self.published_design = None
+        self.reset_count = 0
+        self.applied_design = None
+        self.applied_reset_count = 0
+        self.wakeup = threading.Event()
+        self.running = False
+
+    def set_design(self, compiled, all_pass_chain):
+        """Hot-swap the filter; compiled=None bypasses the main filter"""
+        self.published_design = (compiled, all_pass_chain)
+        self.wakeup.set()
+
+    def submit(self, block):
+        """GUI side: queue a block of input samples"""
+        accepted = self.input_queue.push((self.reset_count, np.asarray(block, dtype=float)))
+        self.wakeup.set()
+        return accepted
+
+    def collect(self):
+        """GUI side: take every output block filtered since the last reset"""
+        blocks = []
+        item = self.output_queue.pop()
+        while item is not None:
+            reset_count, block = item
+            if reset_count == self.reset_count:
+                blocks.append(block)
+            item = self.output_queue.pop()
+        return blocks
+
+    def reset(self):
+        """GUI side: discard queued input and output and clear the filter state before the next block"""
+        self.reset_count += 1
+        self.collect()  # Everything already filtered predates the reset
+        self.wakeup.set()
+
+    def stop(self):
+        """Ask the thread to exit after the current block"""
+        self.running = False
+        self.wakeup.set()
+
+    def run(self):
+        self.running = True
+        while self.running:
+            self.swap_design()
+            item = self.input_queue.pop()
+            if item is None:
+                self.wakeup.wait(0.05)
+                self.wakeup.clear()
+                continue
+            reset_count, block = item
+            if reset_count != self.applied_reset_count:
+                self.swap_design()  # Pick up a reset published since the check above
+            if reset_count != self.applied_reset_count:
+                continue  # Submitted before a reset
+            y = self.process_block(block)
+            # Wait for the GUI to collect output rather than dropping filtered samples
+            while len(self.output_queue) >= self.output_queue.capacity:
+                if not self.running:
+                    return
+                self.wakeup.wait(0.005)
+            self.output_queue.push((reset_count, y))
+
+    def swap_design(self):
+        """Pick up a design or reset published by the GUI thread"""
+        reset_count = self.reset_count
+        if reset_count != self.applied_reset_count:
+            self.applied_reset_count = reset_count
+            self.engine.reset()
+            self.all_pass_chain.reset()
+
+        # Read the reference once; a newer design published meanwhile is seen next block
+        design = self.published_design
+        if design is None or design is self.applied_design:
+            return
+        self.applied_design = design
+        self.compiled, chain = design
+        chain.carry_state_from(self.all_pass_chain)
+        self.all_pass_chain = chain
+
+    def process_block(self, x):
+        """Main filter, then the all-pass chain, with the same clipping as the GUI path"""
+        instrumentation = self.instrumentation
+        try:
+            y = x
+            if self.compiled is not None:
+                with instrumentation.span('filter', x.shape[-1]):
+                    if self.compiled.form == 'direct':
+                        self.engine.set_direct_form(self.compiled.coeffs['b'], self.compiled.coeffs['a'])
+                    else:
+                        self.engine.set_cascade_form(self.compiled.coeffs)
+                    y = np.clip(self.engine.process_block(x), -1.0, 1.0)
+            with instrumentation.span('all_pass', x.shape[-1]):
+                return self.all_pass_chain.process_block(y)
+        except Exception as e:
+            print(f"Error in DSP worker: {e}")
+            instrumentation.count('errors')
+            return x
@@ -0,0 +1,182 @@
+import sys
+
+
+class EditHistory:
+    """
+    Bounded undo/redo store that records what changed between edits.
+
+    A design state is a dict of lists, e.g. {'zeros': [...], 'poles': [...],
+    'all_pass': [...]}. Each recorded edit keeps, per list, only the changed
+    items: either (index, old, new) triples when the length is unchanged
+    (moved roots) or one splice of old/new items when items were added or
+    removed. Undo and redo replay one edit's changes in reverse or forward,
+    so their cost depends on the size of the edit, not of the design.
+
+    Every keyframe_interval-th entry also stores a full snapshot, so any
+    point in the history can be rebuilt from a nearby snapshot (state_at).
+    When the entry or byte cap is exceeded the oldest edits are folded into
+    the base snapshot and dropped.
+
+    Attributes:
+        max_entries (int): Most edits kept
+        max_bytes (int): Approximate memory cap for all edits and snapshots
+        keyframe_interval (int): Edits between full snapshots
+        nbytes (int): Approximate memory currently used
+    """
+    def __init__(self, max_entries=500, max_bytes=4 * 1024 * 1024, keyframe_interval=50):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.keyframe_interval = keyframe_interval
+        self.reset({})
+
+    def reset(self, state):
+        """Forget every edit and start from state"""
+        self.base = self.copy_state(state)
+        self.current = self.copy_state(state)
+        self.entries = []   # [changes, nbytes, snapshot or None]
+        self.position = 0   # Number of entries applied to reach current
+        self.recorded = 0   # Edits ever recorded, used to place keyframes
+        self.base_bytes = self.state_bytes(self.base)
+        self.nbytes = self.base_bytes
+
+    def __len__(self):
+        return len(self.entries)
+
+    def can_undo(self):
+        return self.position > 0
+
+    def can_redo(self):
+        return self.position < len(self.entries)
+
+    def record(self, state):
+        """Store the edit that turned the current state into state; returns False if nothing changed"""
+        changes = {}
+        for key in set(self.current) | set(state):
+            change = self.diff(self.current.get(key, []), list(state.get(key, [])))
+            if change is not None:
+                changes[key] = change
+        if not changes:
+            return False
+
+        # A new edit discards everything that could have been redone
+        while len(self.entries) > self.position:
+            self.nbytes -= self.entries.pop()[1]
+
+        for key, change in changes.items():
+            self.apply(self.current.setdefault(key, []), change, forward=True)
+
+        self.recorded += 1
+        snapshot = None
+        size = sum(self.change_bytes(change) for change in changes.values())
+        if self.recorded % self.keyframe_interval == 0:
+            snapshot = self.copy_state(self.current)
+            size += self.state_bytes(snapshot)
+        self.entries.append([changes, size, snapshot])
+        self.position += 1
+        self.nbytes += size
+        self.trim()
+        return True
+
+    def undo(self):
+        """Step back one edit and return the resulting state, or None at the oldest edit"""
+        if not self.can_undo():
+            return None
+        self.position -= 1
+        for key, change in self.entries[self.position][0].items():
+            self.apply(self.current[key], change, forward=False)
+        return self.copy_state(self.current)
+
+    def redo(self):
+        """Step forward one edit and return the resulting state, or None at the newest edit"""
+        if not self.can_redo():
+            return None
+        for key, change in self.entries[self.position][0].items():
+            self.apply(self.current.setdefault(key, []), change, forward=True)
+        self.position += 1
+        return self.copy_state(self.current)
+
+    def state_at(self, position):
+        """Rebuild the state after position edits from the nearest earlier snapshot"""
+        start, state = 0, self.base
+        for i in range(min(position, len(self.entries)) - 1, -1, -1):
+            if self.entries[i][2] is not None:
+                start, state = i + 1, self.entries[i][2]
+                break
+        state = self.copy_state(state)
+        for changes, _, _ in self.entries[start:position]:
+            for key, change in changes.items():
+                self.apply(state.setdefault(key, []), change, forward=True)
+        return state
+
+    def trim(self):
+        """Fold the oldest edits into the base snapshot until both caps are met"""
+        while len(self.entries) > 1 and (len(self.entries) > self.max_entries
+                                         or self.nbytes > self.max_bytes):
+            changes, size, snapshot = self.entries.pop(0)
+            self.nbytes -= size + self.base_bytes
+            if snapshot is not None:
+                self.base = snapshot
+                self.base_bytes = self.state_bytes(snapshot)
+            else:
+                for key, change in changes.items():
+                    self.apply(self.base.setdefault(key, []), change, forward=True)
+                    self.base_bytes += self.growth_bytes(change)
+            self.nbytes += self.base_bytes
+            self.position = max(0, self.position - 1)
+
+    @staticmethod
+    def diff(old, new):
+        """Smallest change turning list old into list new, or None if they are equal"""
+        if len(old) == len(new):
+            moved = [(i, a, b) for i, (a, b) in enumerate(zip(old, new)) if a != b]
+            return ('set', moved) if moved else None
+
+        # Added or removed items: one splice between the common prefix and suffix
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and old[start] == new[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[-1 - end] == new[-1 - end]:
+            end += 1
+        return ('splice', start, old[start:len(old) - end], new[start:len(new) - end])
+
+    @staticmethod
+    def apply(items, change, forward):
+        """Apply a change to a list in place, or revert it when forward is False"""
+        if change[0] == 'set':
+            for i, old, new in change[1]:
+                items[i] = new if forward else old
+        else:
+            _, start, old, new = change
+            removed, inserted = (old, new) if forward else (new, old)
+            items[start:start + len(removed)] = inserted
+
+    @staticmethod
+    def copy_state(state):
+        return {key: list(items) for key, items in state.items()}
+
+    @staticmethod
+    def state_bytes(state):
+        """Approximate memory of a snapshot: list slots plus the items they point to"""
+        return sum(sys.getsizeof(items) + sum(sys.getsizeof(x) for x in items)
+                   for items in state.values())
+
+    @staticmethod
+    def growth_bytes(change):
+        """Change in snapshot size once a change is applied"""
+        if change[0] == 'set':
+            return 0
+        _, _, old, new = change
+        return (8 * (len(new) - len(old))
+                + sum(sys.getsizeof(x) for x in new) - sum(sys.getsizeof(x) for x in old))
+
+    @staticmethod
+    def change_bytes(change):
+        if change[0] == 'set':
+            return sys.getsizeof(change[1]) + sum(
+                sys.getsizeof(entry) + sys.getsizeof(entry[1]) + sys.getsizeof(entry[2])
+                for entry in change[1])
+        _, _, old, new = change
+        return (sys.getsizeof(old) + sys.getsizeof(new)
+                + sum(sys.getsizeof(x) for x in old) + sum(sys.getsizeof(x) for x in new))
@@ -13,9 +13,8 @@ class Filter:
         self.all_pass_zeros = []
         self.all_pass_poles = []
 
-        # Create filters directory if it doesn't exist
+        # Default directory for saved designs, created only when something is saved into it
         self.filters_dir = Path(__file__).parent / 'filters'
-        self.filters_dir.mkdir(exist_ok=True)
 
         self.subscribers = []  # Subscribers should include callback functions for: Magnitude plot, Phase plot, and elements list.
 
@@ -166,17 +165,24 @@ class Filter:
             'gain': self.gain
         }
 
+        if Path(filename).parent == self.filters_dir:
+            self.filters_dir.mkdir(exist_ok=True)
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2)
 
-    def load_from_file(self, filename):
-        """Load filter from JSON file"""
+    def read_file(self, filename):
+        """Load zeros, poles, all-pass filters and gain from a JSON file as stored, without notifying"""
         with open(filename, 'r') as f:
             data = json.load(f)
 
         self.zeros = [complex(z[0], z[1]) for z in data['zeros']]
         self.poles = [complex(p[0], p[1]) for p in data['poles']]
-        self.all_pass_filters = data['all_pass_filters']
-        self.gain = data['gain']
+        # Designs saved from FilterApp (.flt) only store zeros and poles and are used at unit gain
+        self.all_pass_filters = data.get('all_pass_filters', [])
+        self.gain = float(data.get('gain', 1.0))
         self.parse_all_pass_filters()
+
+    def load_from_file(self, filename):
+        """Load filter from JSON file and notify subscribers (which renormalizes the gain)"""
+        self.read_file(filename)
         self.notify_subscribers()
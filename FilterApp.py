@@ -1,26 +1,77 @@
 import sys
+import time
+
+
+class StartupTimer:
+    """
+    Collects how long each startup stage takes, reported with --startup-timing.
+
+    Stages that are deferred until first use (the real-time tab, pyplot, C code
+    generation) are printed as they happen once the startup report is out.
+    """
+    def __init__(self):
+        self.begin = time.perf_counter()
+        self.stages = []
+        self.enabled = False
+        self.reported = False
+
+    def record(self, stage, start):
+        """Record a stage that began at start (perf_counter) and return the current time"""
+        now = time.perf_counter()
+        self.stages.append((stage, now - start))
+        if self.enabled and self.reported:
+            print(f"[startup] {stage:<28} {(now - start) * 1000:8.1f} ms (first use)")
+        return now
+
+    def report(self):
+        """Print every stage recorded so far and the total time to the first event loop tick"""
+        self.reported = True
+        if not self.enabled:
+            return
+        for stage, elapsed in self.stages:
+            print(f"[startup] {stage:<28} {elapsed * 1000:8.1f} ms")
+        print(f"[startup] {'total':<28} {(time.perf_counter() - self.begin) * 1000:8.1f} ms")
+
+
+STARTUP_TIMER = StartupTimer()
+
+_t = time.perf_counter()
 from PyQt5.QtWidgets import *
-from PyQt5.QtCore import Qt
-import pyqtgraph as pg 
+from PyQt5.QtCore import Qt, QSize, QTimer
 from PyQt5.QtGui import QPalette, QColor
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from matplotlib.patches import Circle
-import numpy as np
-from scipy.signal import zpk2tf, sosfreqz, sos2tf, tf2sos   # Used to convert zeros, poles, and gain to transfer function ,
-import matplotlib.pyplot as plt
-from PyQt5.QtCore import Qt, QSize
+_t = STARTUP_TIMER.record("import PyQt5", _t)
+from matplotlib import style as mpl_style
 from matplotlib.backends.backend_qt5agg import (
     FigureCanvasQTAgg as FigureCanvas,
     NavigationToolbar2QT as NavigationToolbar
 )
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+_t = STARTUP_TIMER.record("import matplotlib", _t)
 import numpy as np
+_t = STARTUP_TIMER.record("import numpy", _t)
 import json
-from PyQt5.QtCore import QTimer
 from collections import deque
-import time
-import pyqtgraph as pg
-pg.setConfigOptions(antialias=True)
+from contextlib import nullcontext
+from pathlib import Path
+from FilterEngine import (FilterEngine, CompiledFilter, AllPassChain, AllPassFilter, AllPassLibrary,
+                          DesignFilter, design_key, roots_to_direct_form, roots_to_sections)
+from ResponseEngine import frequency_response, IncrementalResponse
+from RingBuffer import RingBuffer
+from EditHistory import EditHistory
+from RootIndex import RootIndex
+_t = STARTUP_TIMER.record("import filter modules", _t)
+
+# Real-time input sources: combo box name -> (BlockSignalGenerator kind, parameters)
+SIGNAL_SOURCES = {
+    "Sine Wave": ('sine', {'frequency': 1.0}),
+    "Square Wave": ('square', {'frequency': 0.5}),
+    "Chirp": ('chirp', {'frequency': 0.5, 'stop_frequency': 20.0, 'sweep_time': 10.0}),
+    "Noise": ('white', {}),
+    "Pink Noise": ('pink', {}),
+    "Impulse Train": ('impulse', {'frequency': 1.0}),
+    "Dual Tone": ('dual_tone', {}),
+}
 
 # Dark theme colors
 DARK_PRIMARY = "#1e1e1e"
@@ -42,10 +93,13 @@ class FilterDesignApp(QMainWindow):
         self.setup_toolbar()
 
         self.conjugate_pairs = {'zeros': {}, 'poles': {}}
+
+        # Spatial indexes for z-plane hit-testing, and the click reach in pixels
+        self.root_index = {'zero': RootIndex(), 'pole': RootIndex()}
+        self.hit_radius_px = 12
         
-        # Setup undo/redo
-        self.history = []
-        self.history_index = -1
+        # Setup undo/redo (bounded, stores only what each edit changed)
+        self.history = EditHistory(max_entries=500, max_bytes=4 * 1024 * 1024)
 
         self.dragging = False
         self.drag_target = None
@@ -53,13 +107,24 @@ class FilterDesignApp(QMainWindow):
         self.dragPoint = None
         self.dragOffset = None
 
-        # Initialize filter states
-        self.direct_state = None
-        self.cascade_state = None
+        # Coalesces drag redraws into at most one repaint per frame
+        self.redraw_scheduler = RedrawScheduler(frame_interval_ms=16)
+
+        # Initialize block filtering engine (carries filter state between blocks)
+        self.filter_engine = FilterEngine()
+
+        # Compiled coefficients keyed on the design, rebuilt only after an edit
+        self.filter_cache = {}
+        self.compiled_filter = None
+        # Checked all-pass indices, refreshed by the list/checkbox handlers so the DSP path never reads widgets
+        self.enabled_all_pass = ()
+        self.filter_form = 'direct'
+        self.max_cached_filters = 32
         
         # Initialize all-pass filters
         self.all_pass_filters = []
         self.all_pass_library = AllPassLibrary()
+        self.all_pass_chain = AllPassChain()
         
         
         
@@ -91,30 +156,59 @@ class FilterDesignApp(QMainWindow):
         self.tabs.addTab(self.filter_design_tab, "Filter Design")
         self.tabs.addTab(self.real_time_tab, "Real-time Processing")
         
-        # Setup layouts for each tab
+        # Setup layouts for each tab; the real-time tab is built when first opened
         self.setup_filter_design_tab()
-        self.setup_real_time_tab()
+        self.real_time_tab_built = False
+        self.tabs.currentChanged.connect(self.on_tab_changed)
         
         
         
         
         
-        # Initialize signal processing variables
-        from collections import deque
-        self.max_samples = 10000
-        self.input_signal = deque(maxlen=self.max_samples)
-        self.output_signal = deque(maxlen=self.max_samples)
+        # Initialize signal processing variables; buffers grow to hold a second of fast sources
+        self.min_samples = 10000
+        self.max_samples = self.min_samples
+        # Mono sources fill 1-D buffers; (channels, samples) sources switch them to that many channels
+        self.input_channels = None
+        self.input_signal = RingBuffer(self.max_samples)
+        self.output_signal = RingBuffer(self.max_samples)
+        self.pending_input = []  # Input blocks waiting to be filtered, 1-D or (channels, samples)
         self.buffer_index = 0
         self.last_time = time.time()
         self.last_mouse_pos = None
 
-        # Remove phase_corrected_signal
-        self.processing_speed = 50
+        # DSP timer ticks per second; input samples arrive at the input rate, not per tick
+        self.dsp_rate = 50
         self.last_mouse_y = None
 
-        self.process_timer = QTimer()
-        self.process_timer.timeout.connect(self.process_next_sample)
-        self.process_timer.start(20)
+        # Drawn input is timestamped and resampled to a fixed rate; markers pair an
+        # input sample index with the event it came from to measure latency
+        self.mouse_capture = None  # Created with the real-time tab
+        self.capture_markers = deque()
+
+        # Generated sources have their own rate, independent of drawn input and up to audio rates
+        self.signal_type = "Draw Input"
+        self.signal_generator = None
+        self.generator_rate = 200
+        self.signal_timer = QTimer()
+        self.signal_timer.timeout.connect(self.generate_signal)
+
+        # DSP and display run on separate schedules: the DSP timer filters all
+        # pending input, the render timer repaints at most render_fps times a second.
+        # The DSP timer, the worker thread and the profiler start with the real-time tab
+        self.process_timer = None
+        self.instrumentation = None
+
+        # Filter state lives on a background thread unless use_dsp_worker is off
+        self.use_dsp_worker = True
+        self.worker_design = None
+        self.dsp_worker = None
+
+        # Started together with the real-time tab
+        self.render_fps = 30
+        self.last_rendered_index = 0
+        self.render_timer = QTimer()
+        self.render_timer.timeout.connect(self.render_signal_plots)
 
     def setup_filter_design_tab(self):
         """Setup the filter design tab with z-plane and frequency response"""
@@ -201,6 +295,7 @@ class FilterDesignApp(QMainWindow):
         self.cascade_form.setStyleSheet(radio_style)
         
         self.direct_form.setChecked(True)  # Default to Direct Form II
+        self.direct_form.toggled.connect(self.update_filter_form)
 
         self.export.clicked.connect(self.export_filter)
         
@@ -314,7 +409,7 @@ class FilterDesignApp(QMainWindow):
         left_panel.setLayout(left_layout)
         
         # Update plot styling
-        plt.style.use('dark_background')
+        mpl_style.use('dark_background')
         
         
         
@@ -363,8 +458,34 @@ class FilterDesignApp(QMainWindow):
         
         self.filter_design_tab.setLayout(layout)
 
+    def on_tab_changed(self, index):
+        """Build the real-time tab the first time it is opened"""
+        if self.tabs.widget(index) is self.real_time_tab and not self.real_time_tab_built:
+            _t = time.perf_counter()
+            self.setup_real_time_tab()
+            STARTUP_TIMER.record("real-time tab", _t)
+
     def setup_real_time_tab(self):
         """Setup the real-time processing tab with all-pass filters and signal processing"""
+        # Input capture, sources and the DSP worker are only needed once the tab is open
+        global DSPWorker, Instrumentation, MouseCapture, BlockSignalGenerator
+        from DSPWorker import DSPWorker
+        from Instrumentation import Instrumentation
+        from InputCapture import MouseCapture
+        from SignalGenerator import BlockSignalGenerator
+
+        self.mouse_capture = MouseCapture(sample_rate=200)
+
+        # Opt-in per-stage timing, shown in the stats overlay
+        self.instrumentation = Instrumentation()
+        if self.use_dsp_worker:
+            self.dsp_worker = DSPWorker(instrumentation=self.instrumentation)
+            self.dsp_worker.start()
+
+        self.process_timer = QTimer()
+        self.process_timer.timeout.connect(self.process_next_sample)
+        self.process_timer.start(int(1000 / self.dsp_rate))
+
         layout = QHBoxLayout()
         
         # Combine all-pass and real-time panels
@@ -373,6 +494,8 @@ class FilterDesignApp(QMainWindow):
         layout.addWidget(right_side)
         
         self.real_time_tab.setLayout(layout)
+        self.real_time_tab_built = True
+        self.render_timer.start(int(1000 / self.render_fps))
 
     # Add tab styling
     def setup_tab_styling(self):
@@ -436,6 +559,20 @@ class FilterDesignApp(QMainWindow):
         # Add axes lines
         self.z_ax.axhline(y=0, color=PLOT_TEXT, linestyle='-', alpha=0.3)
         self.z_ax.axvline(x=0, color=PLOT_TEXT, linestyle='-', alpha=0.3)
+
+        # Persistent zero/pole artists, updated with set_data and blitted while editing
+        self.zero_line, = self.z_ax.plot([], [], 'o', color='blue',
+                                         markersize=12, markeredgewidth=2,
+                                         markerfacecolor='none', label='Zeros',
+                                         animated=True)
+        self.pole_line, = self.z_ax.plot([], [], 'x', color='red',
+                                         markersize=12, markeredgewidth=2,
+                                         label='Poles', animated=True)
+        self.z_ax.legend(loc='upper right', facecolor=PLOT_BG, edgecolor=PLOT_TEXT)
+
+        # Background without the zero/pole artists, recaptured on every full draw
+        self.z_background = None
+        self.z_plane_canvas.mpl_connect('draw_event', self.on_z_plane_draw)
         
         # Update frequency response plots styling
         for ax in [self.mag_ax, self.phase_ax]:
@@ -448,6 +585,26 @@ class FilterDesignApp(QMainWindow):
                 spine.set_color(PLOT_TEXT)
                 spine.set_linewidth(1.5)
 
+        # Persistent response lines, updated in place and blitted while editing
+        self.mag_line, = self.mag_ax.plot([], [], 'w-', linewidth=2, animated=True)
+        self.phase_line, = self.phase_ax.plot([], [], 'w-', linewidth=2, animated=True)
+        self.mag_ax.set_ylabel('Magnitude (dB)', color=PLOT_TEXT)
+        self.mag_ax.set_title('Magnitude Response', color=PLOT_TEXT)
+        self.phase_ax.set_xlabel('Normalized Frequency (×π rad/sample)', color=PLOT_TEXT)
+        self.phase_ax.set_ylabel('Phase (degrees)', color=PLOT_TEXT)
+        self.phase_ax.set_title('Phase Response', color=PLOT_TEXT)
+        for ax in [self.mag_ax, self.phase_ax]:
+            ax.set_xlim(0, 1)
+
+        self.freq_background = None
+        self.freq_resolution = 2000  # Frequency grid points for the response plots
+        self.freq_method = 'product'  # 'product' (root product), 'fft' (zero-padded b/a FFT) or 'log'
+        # Cached root product, so dragging one root only patches its own factor
+        self.response_model = IncrementalResponse(self.freq_resolution)
+        self.freq_canvas.mpl_connect('draw_event', self.on_freq_draw)
+        self.freq_canvas.mpl_connect('resize_event', self.on_freq_resize)
+        self.freq_figure.tight_layout()
+
 
     def set_mode(self, mode):
         """Sets the current tool mode (zero/pole/drag) and updates button states"""
@@ -473,113 +630,131 @@ class FilterDesignApp(QMainWindow):
         self.zeros = []
         self.poles = []
         self.add_to_history()
+        self.invalidate_filter_cache()
         self.update_plots()
             
             
     def clear_zeros(self):
         self.zeros = []
+        self.invalidate_filter_cache()
         self.update_plots()
 
     def clear_poles(self):
         self.poles = []
+        self.invalidate_filter_cache()
         self.update_plots()
 
     
     def swap_zeros_poles(self):
         self.zeros, self.poles = self.poles.copy(), self.zeros.copy()
         self.add_to_history()
+        self.invalidate_filter_cache()
         self.update_plots()
 
     
     def update_plots(self):
-        self.z_ax.clear()
-        
-        # Redraw enhanced unit circle and grid
-        circle = Circle((0, 0), 1, fill=False, color=PLOT_TEXT, linestyle='--', linewidth=2)
-        self.z_ax.add_artist(circle)
-        
-        # Enhanced grid setup
-        self.z_ax.grid(True, which='both', color=PLOT_GRID, linestyle='--', alpha=0.5)
-        self.z_ax.set_aspect('equal')
-        self.z_ax.set_xlim(-2, 2)
-        self.z_ax.set_ylim(-2, 2)
-        
-        # Plot zeros and poles with enhanced markers
-        for zero in self.zeros:
-            self.z_ax.plot(zero.real, zero.imag, 'o', color='blue', 
-                        markersize=12, markeredgewidth=2, 
-                        markerfacecolor='none', label='Zeros')
-        
-        for pole in self.poles:
-            self.z_ax.plot(pole.real, pole.imag, 'x', color='red',
-                        markersize=12, markeredgewidth=2,
-                        label='Poles')
-        
-        # Enhanced axes and labels
-        self.z_ax.set_xlabel('Real Part', color=PLOT_TEXT, fontsize=12)
-        self.z_ax.set_ylabel('Imaginary Part', color=PLOT_TEXT, fontsize=12)
-        self.z_ax.set_title('Z-Plane Plot', color=PLOT_TEXT, fontsize=14, pad=20)
-        
-        # Add legend
-        handles, labels = self.z_ax.get_legend_handles_labels()
-        by_label = dict(zip(labels, handles))
-        self.z_ax.legend(by_label.values(), by_label.keys(), 
-                        loc='upper right', facecolor=PLOT_BG, 
-                        edgecolor=PLOT_TEXT)
-        
-        self.z_plane_canvas.draw()
+        self.update_z_plane()
         self.update_frequency_response()
+
+    def request_plot_update(self):
+        """Schedule a z-plane and frequency-response repaint for the next frame"""
+        self.redraw_scheduler.request('z_plane', self.update_z_plane)
+        self.redraw_scheduler.request('frequency', self.update_frequency_response)
+
+    def update_z_plane(self):
+        """Move the persistent zero/pole artists and blit them over the cached background"""
+        zeros = np.asarray(self.zeros, dtype=complex)
+        poles = np.asarray(self.poles, dtype=complex)
+        self.zero_line.set_data(zeros.real, zeros.imag)
+        self.pole_line.set_data(poles.real, poles.imag)
+
+        if self.z_background is None:
+            # First draw (or after a resize): draw_event captures the background
+            self.z_plane_canvas.draw()
+            return
+
+        self.z_plane_canvas.restore_region(self.z_background)
+        self.z_ax.draw_artist(self.zero_line)
+        self.z_ax.draw_artist(self.pole_line)
+        self.z_plane_canvas.blit(self.z_ax.bbox)
+
+    def on_z_plane_draw(self, event):
+        """Cache the static z-plane background after a full redraw"""
+        self.z_background = self.z_plane_canvas.copy_from_bbox(self.z_ax.bbox)
+        self.z_ax.draw_artist(self.zero_line)
+        self.z_ax.draw_artist(self.pole_line)
         
     def update_frequency_response(self):
         """Update frequency response including all-pass effects"""
-        # Calculate frequency points
-        w = np.linspace(0, np.pi, 2000)
-        z = np.exp(1j * w)
-        
-        # Main filter transfer function
-        H = np.ones_like(z, dtype=complex)
-        for zero in self.zeros:
-            H *= (z - zero)
-        for pole in self.poles:
-            H /= (z - pole)
-        
+        zeros = list(self.zeros)
+        poles = list(self.poles)
+        gain = 1.0
+
         # Apply all-pass filters
-        if hasattr(self, 'all_pass_enabled') and self.all_pass_enabled.isChecked():
-            for i in range(self.all_pass_list.count()):
-                item = self.all_pass_list.item(i)
-                if item.checkState() == Qt.Checked:
-                    filter = self.all_pass_library.get_filter(i)
-                    if filter:
-                        # Calculate all-pass transfer function properly
-                        num = z - filter.zero  # Numerator
-                        den = 1 - filter.pole * z  # Denominator
-                        H_ap = num / den
-                        H *= H_ap  # Apply to main transfer function
-        
+        for idx in self.enabled_all_pass_indices():
+            filter = self.all_pass_library.get_filter(idx)
+            if filter:
+                # (z - zero) / (1 - pole*z) == -1/pole * (z - zero) / (z - 1/pole)
+                zeros.append(filter.zero)
+                poles.append(1 / filter.pole)
+                gain *= -1 / filter.pole
+
         # Calculate magnitude and phase responses
-        mag_db = 20 * np.log10(np.abs(H))
-        phase_deg = np.unwrap(np.angle(H)) * 180 / np.pi  # Convert to degrees
-        
-        # Clear previous plots
-        self.mag_ax.clear()
-        self.phase_ax.clear()
-        
-        # Plot magnitude response
-        self.mag_ax.plot(w/np.pi, mag_db, 'w-', linewidth=2)
-        self.mag_ax.set_ylabel('Magnitude (dB)', color=PLOT_TEXT)
-        self.mag_ax.set_title('Magnitude Response', color=PLOT_TEXT)
-        self.mag_ax.grid(True)
-        
-        # Plot phase response
-        self.phase_ax.plot(w/np.pi, phase_deg, 'w-', linewidth=2)
-        self.phase_ax.set_xlabel('Normalized Frequency (×π rad/sample)', color=PLOT_TEXT)
-        self.phase_ax.set_ylabel('Phase (degrees)', color=PLOT_TEXT)
-        self.phase_ax.set_title('Phase Response', color=PLOT_TEXT)
-        self.phase_ax.grid(True)
-        
-        # Update plots
+        if self.freq_method == 'product':
+            self.response_model.update(zeros, poles, gain)
+            w, mag_db, phase_rad = self.response_model.response()
+        else:
+            w, mag_db, phase_rad = frequency_response(zeros, poles, gain,
+                                                      num_points=self.freq_resolution,
+                                                      method=self.freq_method)
+        phase_deg = np.unwrap(phase_rad) * 180 / np.pi  # Convert to degrees
+
+        # Move the persistent response lines
+        w_norm = w / np.pi
+        self.mag_line.set_data(w_norm, mag_db)
+        self.phase_line.set_data(w_norm, phase_deg)
+
+        limits_changed = self.update_axis_range(self.mag_ax, mag_db)
+        limits_changed = self.update_axis_range(self.phase_ax, phase_deg) or limits_changed
+
+        # Ticks only need redrawing when a range changed; otherwise blit the lines
+        if limits_changed or self.freq_background is None:
+            self.freq_background = None
+            self.freq_canvas.draw_idle()
+            return
+
+        self.freq_canvas.restore_region(self.freq_background)
+        self.mag_ax.draw_artist(self.mag_line)
+        self.phase_ax.draw_artist(self.phase_line)
+        self.freq_canvas.blit(self.freq_figure.bbox)
+
+    def update_axis_range(self, ax, data):
+        """Fit the y-range to the data, keeping the current range while it still fits well"""
+        finite = data[np.isfinite(data)]
+        if finite.size == 0:
+            return False
+
+        low, high = finite.min(), finite.max()
+        pad = max(0.05 * (high - low), 1.0)
+        current_low, current_high = ax.get_ylim()
+        fits = current_low <= low and high <= current_high
+        # Shrink again once the data fills less than half of the current range
+        if fits and (high - low + 2 * pad) >= 0.5 * (current_high - current_low):
+            return False
+
+        ax.set_ylim(low - pad, high + pad)
+        return True
+
+    def on_freq_draw(self, event):
+        """Cache the static frequency-response background after a full redraw"""
+        self.freq_background = self.freq_canvas.copy_from_bbox(self.freq_figure.bbox)
+        self.mag_ax.draw_artist(self.mag_line)
+        self.phase_ax.draw_artist(self.phase_line)
+
+    def on_freq_resize(self, event):
+        """Recompute the layout only when the canvas size changes"""
         self.freq_figure.tight_layout()
-        self.freq_canvas.draw()
+        self.freq_background = None
 
     def setup_toolbar(self):
         toolbar = QToolBar()
@@ -594,6 +769,9 @@ class FilterDesignApp(QMainWindow):
         load_action = QAction("Load Filter", self)
         load_action.setShortcut("Ctrl+O")
         load_action.triggered.connect(self.load_filter)
+
+        filter_file_action = QAction("Filter File", self)
+        filter_file_action.triggered.connect(self.filter_signal_file)
         
         # Edit operations
         undo_action = QAction("Undo", self)
@@ -607,6 +785,7 @@ class FilterDesignApp(QMainWindow):
         # Add actions to toolbar
         toolbar.addAction(save_action)
         toolbar.addAction(load_action)
+        toolbar.addAction(filter_file_action)
         toolbar.addSeparator()
         toolbar.addAction(undo_action)
         toolbar.addAction(redo_action)
@@ -747,6 +926,7 @@ class FilterDesignApp(QMainWindow):
             return
 
         # Update the plots with the newly loaded zeros and poles
+        self.invalidate_filter_cache()
         self.update_plots()
 
 
@@ -806,55 +986,109 @@ class FilterDesignApp(QMainWindow):
                 self.poles = [complex(p[0], p[1]) for p in data['poles']]
                 
                 self.add_to_history()
+                self.invalidate_filter_cache()
                 self.update_plots()
                 
             except Exception as e:
                 QMessageBox.warning(self, "Load Error", 
                                 f"Error loading filter file: {str(e)}")
             
+    def filter_signal_file(self):
+        """Filter a CSV/NPY/WAV signal file offline with the current design"""
+        in_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Filter Signal File",
+            "",
+            "Signal Files (*.csv *.npy *.wav);;All Files (*)"
+        )
+        if not in_path:
+            return
+
+        suffix = Path(in_path).suffix.lower()
+        out_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Filtered Signal",
+            str(Path(in_path).with_name(Path(in_path).stem + "_filtered" + suffix)),
+            f"Signal Files (*{suffix})"
+        )
+        if not out_path:
+            return
+        if not out_path.lower().endswith(suffix):
+            out_path += suffix
+
+        compiled = self.get_compiled_filter()
+        main_filter = compiled if (self.zeros or self.poles) else None
+
+        def make_filter():
+            return DesignFilter(main_filter, self.all_pass_library.compile(compiled.all_pass))
+
+        from OfflineFilter import filter_file
+
+        try:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                n_samples = filter_file(in_path, out_path, make_filter)
+            finally:
+                QApplication.restoreOverrideCursor()
+            QMessageBox.information(self, "Filtering Complete",
+                                    f"Filtered {n_samples} samples to {out_path}")
+        except Exception as e:
+            QMessageBox.warning(self, "Filtering Error",
+                                f"Error filtering signal file: {str(e)}")
+
     def undo(self):
-        if self.history_index > 0:
-            self.history_index -= 1
-            state = self.history[self.history_index]
-            self.zeros = state['zeros'].copy()
-            self.poles = state['poles'].copy()
-            self.all_pass_filters = [AllPassFilter(a) for a in state['all_pass']]
-            self.update_plots()
+        state = self.history.undo()
+        if state is not None:
+            self.restore_state(state)
             
     def redo(self):
-        if self.history_index < len(self.history) - 1:
-            self.history_index += 1
-            state = self.history[self.history_index]
-            self.zeros = state['zeros'].copy()
-            self.poles = state['poles'].copy()
-            self.all_pass_filters = [AllPassFilter(a) for a in state['all_pass']]
-            self.update_plots()
+        state = self.history.redo()
+        if state is not None:
+            self.restore_state(state)
+
+    def restore_state(self, state):
+        """Apply a design state returned by the edit history"""
+        self.zeros = state.get('zeros', [])
+        self.poles = state.get('poles', [])
+        self.all_pass_filters = [AllPassFilter(a) for a in state.get('all_pass', [])]
+        self.invalidate_filter_cache()
+        self.update_plots()
 
     def save_state(self):
         """Save current filter state for undo/redo"""
-        state = {
-            'zeros': self.zeros.copy(),
-            'poles': self.poles.copy(),
-            'all_pass': self.all_pass_filters.copy()
-        }
-        self.history.append(state)
-        self.current_state += 1
+        self.add_to_history()
 
-    def reset_filter_states(self):
-        """Reset filter states when coefficients change"""
-        self.direct_state = None
-        self.cascade_state = None
-        self.input_signal.clear()
-        self.output_signal.clear()
+    def get_root_index(self, kind):
+        """Spatial index of the zeros or poles, rebuilt if the list was replaced"""
+        index = self.root_index[kind]
+        index.sync(self.zeros if kind == 'zero' else self.poles)
+        return index
+
+    def pixel_scale(self):
+        """Screen pixels per data unit along x and y of the z-plane"""
+        (x0, y0), (x1, y1) = self.z_ax.transData.transform([(0.0, 0.0), (1.0, 1.0)])
+        return max(abs(x1 - x0), 1e-9), max(abs(y1 - y0), 1e-9)
+
+    def find_root(self, x, y):
+        """(kind, index) of the zero or pole nearest the click on screen, or None"""
+        scale = self.pixel_scale()
+        best, best_d2 = None, None
+        for kind in ('zero', 'pole'):
+            index = self.get_root_index(kind)
+            i = index.nearest(x, y, self.hit_radius_px, scale)
+            if i is None:
+                continue
+            p = index.positions[i]
+            d2 = ((p.real - x) * scale[0]) ** 2 + ((p.imag - y) * scale[1]) ** 2
+            if best is None or d2 < best_d2:
+                best, best_d2 = (kind, i), d2
+        return best
 
     def find_conjugate(self, idx, points):
         """Find index of conjugate pair for given point"""
         point = points[idx]
-        for i, p in enumerate(points):
-            # Check if this is a different point with conjugate coordinates
-            if i != idx and abs(p.real - point.real) < 0.01 and abs(p.imag + point.imag) < 0.01:
-                return i
-        return None
+        index = self.get_root_index('zero' if points is self.zeros else 'pole')
+        return index.nearest(point.real, -point.imag, 0.01, exclude=idx)
 
     def on_press(self, event):
         if event.inaxes != self.z_ax:
@@ -869,22 +1103,14 @@ class FilterDesignApp(QMainWindow):
         
         # Left click to add or start dragging
         elif event.button == 1:
-            # Check for dragging first
-            for i, zero in enumerate(self.zeros):
-                if abs(zero.real - x) < 0.1 and abs(zero.imag - y) < 0.1:
-                    self.dragging = True
-                    self.drag_target = i
-                    self.drag_type = 'zero'
-                    self.z_plane_canvas.setCursor(Qt.ClosedHandCursor)
-                    return
-                    
-            for i, pole in enumerate(self.poles):
-                if abs(pole.real - x) < 0.1 and abs(pole.imag - y) < 0.1:
-                    self.dragging = True
-                    self.drag_target = i
-                    self.drag_type = 'pole'
-                    self.z_plane_canvas.setCursor(Qt.ClosedHandCursor)
-                    return
+            # Check for dragging first (nearest root on screen)
+            hit = self.find_root(x, y)
+            if hit is not None:
+                self.dragging = True
+                self.drag_type, self.drag_target = hit
+                self.redraw_scheduler.reset_stats()
+                self.z_plane_canvas.setCursor(Qt.ClosedHandCursor)
+                return
             
             # If not dragging, add new point if in add mode
             if self.current_mode:
@@ -901,20 +1127,24 @@ class FilterDesignApp(QMainWindow):
                 
         points = self.zeros if self.current_mode == 'zero' else self.poles
         pairs_dict = self.conjugate_pairs['zeros' if self.current_mode == 'zero' else 'poles']
+        index = self.get_root_index(self.current_mode)
         
         # Add main point
         idx = len(points)
         points.append(complex(x, y))
+        index.insert(complex(x, y))
         
         # Add conjugate if enabled
         if self.conjugate_check.isChecked():
             conj_idx = len(points)
             points.append(complex(x, -y))
+            index.insert(complex(x, -y))
             # Store bidirectional reference
             pairs_dict[idx] = conj_idx
             pairs_dict[conj_idx] = idx
         
         self.add_to_history()
+        self.invalidate_filter_cache()
         self.update_plots()
 
     def on_motion(self, event):
@@ -935,64 +1165,63 @@ class FilterDesignApp(QMainWindow):
         # Get active arrays
         points = self.zeros if self.drag_type == 'zero' else self.poles
         pairs_dict = self.conjugate_pairs['zeros' if self.drag_type == 'zero' else 'poles']
+        index = self.get_root_index(self.drag_type)
         
         # Update main point
         points[self.drag_target] = complex(x, y)
+        index.move(self.drag_target, complex(x, y))
         
         # Update conjugate if it exists
         if self.drag_target in pairs_dict:
             conj_idx = pairs_dict[self.drag_target]
             points[conj_idx] = complex(x, -y)  # Mirror y-coordinate only
+            index.move(conj_idx, complex(x, -y))
         
-        self.update_plots()
+        self.invalidate_filter_cache()
+        self.request_plot_update()
 
     def handle_deletion(self, x, y):
         """Handle deletion of points and their conjugates"""
-        # Check zeros
-        for i, zero in enumerate(self.zeros):
-            if abs(zero.real - x) < 0.1 and abs(zero.imag - y) < 0.1:
-                # Delete conjugate if exists
-                if i in self.conjugate_pairs['zeros']:
-                    conj_idx = self.conjugate_pairs['zeros'][i]
-                    # Remove the one with larger index first
-                    if conj_idx > i:
-                        self.zeros.pop(conj_idx)
-                        self.zeros.pop(i)
-                    else:
-                        self.zeros.pop(i)
-                        self.zeros.pop(conj_idx)
-                    # Clean up conjugate pairs
-                    del self.conjugate_pairs['zeros'][i]
-                    del self.conjugate_pairs['zeros'][conj_idx]
-                else:
-                    self.zeros.pop(i)
-                self.add_to_history()
-                self.update_plots()
-                return
+        hit = self.find_root(x, y)
+        if hit is None:
+            return
 
-        # Check poles - same logic as zeros
-        for i, pole in enumerate(self.poles):
-            if abs(pole.real - x) < 0.1 and abs(pole.imag - y) < 0.1:
-                if i in self.conjugate_pairs['poles']:
-                    conj_idx = self.conjugate_pairs['poles'][i]
-                    if conj_idx > i:
-                        self.poles.pop(conj_idx)
-                        self.poles.pop(i)
-                    else:
-                        self.poles.pop(i)
-                        self.poles.pop(conj_idx)
-                    del self.conjugate_pairs['poles'][i]
-                    del self.conjugate_pairs['poles'][conj_idx]
-                else:
-                    self.poles.pop(i)
-                self.add_to_history()
-                self.update_plots()
-                return
+        kind, i = hit
+        points = self.zeros if kind == 'zero' else self.poles
+        pairs_dict = self.conjugate_pairs['zeros' if kind == 'zero' else 'poles']
+        index = self.get_root_index(kind)
+
+        # Delete conjugate if exists, removing the one with larger index first
+        removed = [i]
+        if i in pairs_dict:
+            conj_idx = pairs_dict[i]
+            removed = sorted([i, conj_idx], reverse=True)
+            # Clean up conjugate pairs
+            del pairs_dict[i]
+            del pairs_dict[conj_idx]
+        for idx in removed:
+            # Swap-remove: the last root fills the gap, so it is the only one that changes index
+            points[idx] = points[-1]
+            points.pop()
+            moved = index.remove(idx)
+            if moved is not None and moved in pairs_dict:
+                partner = pairs_dict.pop(moved)
+                pairs_dict[idx] = partner
+                pairs_dict[partner] = idx
+
+        self.add_to_history()
+        self.invalidate_filter_cache()
+        self.update_plots()
 
     def on_release(self, event):
         """Handle mouse release after dragging"""
         if self.dragging:
             self.dragging = False
+            # Paint the final drag position right away
+            self.redraw_scheduler.flush()
+            stats = self.redraw_scheduler.stats()
+            self.statusBar().showMessage(
+                f"Redraw: {stats['fps']:.0f} fps, {stats['dropped']} updates coalesced")
             self.add_to_history()
             self.drag_target = None
             self.drag_type = None
@@ -1006,12 +1235,17 @@ class FilterDesignApp(QMainWindow):
         """Generate C code for the current filter design"""
         try:
             # Get coefficients based on selected form
+            # Templates are only needed here, so load them on first use
+            _t = time.perf_counter()
+            import CodeGenerator
+            STARTUP_TIMER.record("import CodeGenerator", _t)
+
             if self.direct_form.isChecked():
                 coeffs = self.generate_direct_form_II()
-                c_code = self._generate_direct_form_c(coeffs)
+                c_code = CodeGenerator.direct_form_c(coeffs)
             else:
                 coeffs = self.generate_cascade_form()
-                c_code = self._generate_cascade_form_c(coeffs)
+                c_code = CodeGenerator.cascade_form_c(coeffs)
             
             # Save to file with proper path handling
             file_name = "filter_implementation.c"
@@ -1021,255 +1255,247 @@ class FilterDesignApp(QMainWindow):
         except Exception as e:
             print(f"Error generating C code: {e}")
 
-    def _generate_direct_form_c(self, coeffs):
-        """Generate Direct Form II implementation"""
-        b = coeffs['b']
-        a = coeffs['a']
-        
-        template = [
-            '#include <stdio.h>',
-            '#include <stdlib.h>',
-            '#include <math.h>',
-            '',
-            f'#define NUM_B {len(b)}',
-            f'#define NUM_A {len(a)}',
-            '',
-            'typedef struct {',
-            '    double *state;',
-            '    int state_size;',
-            '} FilterState;',
-            '',
-            f'static const double b[NUM_B] = {{{", ".join([f"{x.real:.10f}" for x in b])}}};\n',
-            f'static const double a[NUM_A] = {{{", ".join([f"{x.real:.10f}" for x in a])}}};\n',
-            '',
-            'FilterState* filter_init(void) {',
-            '    FilterState* f = (FilterState*)malloc(sizeof(FilterState));',
-            '    f->state_size = NUM_A - 1;',
-            '    f->state = (double*)calloc(f->state_size, sizeof(double));',
-            '    return f;',
-            '}',
-            '',
-            'double filter_process(FilterState* f, double x) {',
-            '    double w = x;',
-            '    for(int i = 0; i < f->state_size; i++) {',
-            '        w -= a[i+1] * f->state[i];',
-            '    }',
-            '    double y = b[0] * w;',
-            '    for(int i = 0; i < f->state_size; i++) {',
-            '        y += b[i+1] * f->state[i];',
-            '    }',
-            '    for(int i = f->state_size-1; i > 0; i--) {',
-            '        f->state[i] = f->state[i-1];',
-            '    }',
-            '    f->state[0] = w;',
-            '    return y;',
-            '}',
-            '',
-            'void filter_free(FilterState* f) {',
-            '    free(f->state);',
-            '    free(f);',
-            '}',
-            '',
-            'int main(void) {',
-            '    FilterState* filter = filter_init();',
-            '    double input[10] = {1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0};',
-            '    double output;',
-            '    for(int i = 0; i < 10; i++) {',
-            '        output = filter_process(filter, input[i]);',
-            '        printf("Sample %d: in=%.4f, out=%.4f\\n", i, input[i], output);',
-            '    }',
-            '    filter_free(filter);',
-            '    return 0;',
-            '}'
-        ]
-        
-        return '\n'.join(template)
-
-    def _generate_cascade_form_c(self, coeffs):
-        """Generate Cascade Form implementation"""
-        template = [
-            '#include <stdio.h>',
-            '#include <stdlib.h>',
-            '#include <math.h>',
-            '',
-            f'#define NUM_SECTIONS {len(coeffs)}',
-            '',
-            'typedef struct {',
-            '    double state[NUM_SECTIONS][2];',
-            '} FilterState;',
-            '',
-            'static const double sos[NUM_SECTIONS][6] = {',
-            ',\n'.join([f'    {{ {", ".join(f"{x:.10f}" for x in section)} }}' for section in coeffs]),
-            '};',
-            '',
-            'FilterState* filter_init(void) {',
-            '    FilterState* f = (FilterState*)malloc(sizeof(FilterState));',
-            '    for(int i = 0; i < NUM_SECTIONS; i++) {',
-            '        f->state[i][0] = 0.0;',
-            '        f->state[i][1] = 0.0;',
-            '    }',
-            '    return f;',
-            '}',
-            '',
-            'double filter_process(FilterState* f, double x) {',
-            '    double y = x, w;',
-            '    for(int i = 0; i < NUM_SECTIONS; i++) {',
-            '        w = y - sos[i][4]*f->state[i][0] - sos[i][5]*f->state[i][1];',
-            '        y = sos[i][0]*w + sos[i][1]*f->state[i][0] + sos[i][2]*f->state[i][1];',
-            '        f->state[i][1] = f->state[i][0];',
-            '        f->state[i][0] = w;',
-            '    }',
-            '    return y;',
-            '}',
-            '',
-            'void filter_free(FilterState* f) {',
-            '    free(f);',
-            '}',
-            '',
-            'int main(void) {',
-            '    FilterState* filter = filter_init();',
-            '    double input[10] = {1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0};',
-            '    double output;',
-            '    for(int i = 0; i < 10; i++) {',
-            '        output = filter_process(filter, input[i]);',
-            '        printf("Sample %d: in=%.4f, out=%.4f\\n", i, input[i], output);',
-            '    }',
-            '    filter_free(filter);',
-            '    return 0;',
-            '}'
-        ]
-        
-        return '\n'.join(template)
-
-
     ########################## real time plotting ############################
 
-    def update_speed(self, value):
-        """Update processing speed with proper timing"""
-        self.processing_speed = value
-        interval = max(1, int(1000 / value))  # Ensure minimum 1ms interval
-        self.process_timer.setInterval(interval)
-        
-        # Clear buffers on speed change
-        if len(self.input_signal) > value * 10:
-            self.input_signal = deque(list(self.input_signal)[-value*10:], 
-                                    maxlen=value*10)
-            self.output_signal = deque(list(self.output_signal)[-value*10:], 
-                                    maxlen=value*10)
-    
+    def push_input_samples(self, samples):
+        """Queue a 1-D or (channels, samples) block of input for filtering on the next processing step"""
+        block = np.atleast_1d(np.asarray(samples, dtype=float))
+        if block.size == 0:
+            return
+        channels = block.shape[0] if block.ndim == 2 else None
+        if channels != self.input_channels:
+            self.set_input_channels(channels)
+        self.input_signal.extend(block)
+        self.pending_input.append(block)
+
+    def set_input_channels(self, channels):
+        """Start a new stream with channels values per sample (None for mono)"""
+        self.reset_signal_buffers()
+        self.input_channels = channels
+        self.input_signal = RingBuffer(self.max_samples, channels)
+        self.output_signal = RingBuffer(self.max_samples, channels)
+
     def process_next_sample(self):
-        """Main processing chain"""
+        """Main processing chain, filtering every pending input sample as one block"""
+        self.read_mouse_capture()
+        # Store worker output every tick, including ticks with no new input
+        self.collect_worker_output()
         if not self.input_signal:
             return
-                    
+
+        x = None
         try:
-            # 1. Get input sample
-            x = self.input_signal[-1]
-            
+            # 1. Collect all pending input; hold the last sample if nothing new arrived
+            if not self.pending_input:
+                if self.signal_generator is not None or self.mouse_capture.start_time is not None:
+                    return  # Fixed-rate input; no sample is due yet
+                self.push_input_samples(self.input_signal.latest(1))
+            # Blocks are joined along time, so a (channels, samples) stream keeps its channels
+            x = np.concatenate(self.pending_input, axis=-1)
+            self.pending_input.clear()
+
+            if self.dsp_worker is not None:
+                self.process_on_worker(x)
+                return
+
             # 2. Apply main filter (from z-plane design)
-            y = self.apply_selected_filter(x)
-            
+            with self.instrumentation.span('filter', x.shape[-1]):
+                y = self.apply_selected_filter(x)
+
             # 3. Apply all-pass filters (optional)
-            if self.all_pass_enabled.isChecked():
+            with self.instrumentation.span('all_pass', x.shape[-1]):
                 y = self.apply_all_pass_filters(y)
-                    
-            # 4. Store output and ensure signal buffers match
-            self.output_signal.append(float(y))
-            
-            # Ensure input and output buffers have same length
-            while len(self.output_signal) < len(self.input_signal):
-                self.output_signal.append(float(y))
-            while len(self.input_signal) < len(self.output_signal):
-                self.input_signal.append(float(x))
-                
-            # 5. Update visualization
-            self.update_signal_plots()
-        
-        except Exception as e:
-            print(f"Error processing sample: {e}")
 
+            # 4. Store output block alongside the input (plotted by the render timer)
+            self.store_output(y)
+            self.check_capture_latency()
 
-    def on_mouse_draw(self, event):
-        """Handle mouse movement in drawing area to generate input signal"""
-        if not hasattr(self, 'last_y'):
-            self.last_y = event.y()
+        except Exception as e:
+            print(f"Error processing sample: {e}")
+            self.instrumentation.count('errors')
+            if x is not None:
+                self.instrumentation.count('error_samples', x.shape[-1])
+
+
+    def process_on_worker(self, x):
+        """Hand a block to the DSP worker and store whatever it has filtered so far"""
+        self.sync_worker_design()
+        if not self.dsp_worker.submit(x):
+            # Worker is behind; keep the block and retry on the next tick, at most a buffer's worth
+            self.instrumentation.count('queue_full')
+            overflow = x.shape[-1] - self.output_signal.capacity
+            if overflow > 0:
+                self.instrumentation.count('dropped_samples', overflow)
+                x = x[..., overflow:]
+            self.pending_input.append(x)
+        self.collect_worker_output()
+
+    def collect_worker_output(self):
+        """Store every block the DSP worker has filtered since the last tick"""
+        if self.dsp_worker is None:
             return
-                
-        # Calculate vertical displacement for frequency
-        dy = event.y() - self.last_y
-        
-        # Convert mouse movement to signal value (-1 to 1 range)
-        y = (self.draw_area.height() - event.y()) / self.draw_area.height() * 2 - 1
-        
-        # Add to input buffer with rate limiting
-        if len(self.input_signal) < 10000:  # Maintain max buffer size
-            self.input_signal.append(y)
+        for y in self.dsp_worker.collect():
+            self.store_output(y)
+        self.check_capture_latency()
+
+    def store_output(self, y):
+        """Append filtered samples, counting any that overflow the output buffer as dropped"""
+        overflow = self.output_signal.extend(y)
+        if overflow:
+            self.instrumentation.count('dropped_samples', overflow)
+
+    def read_mouse_capture(self):
+        """Queue the drawn input resampled onto the fixed-rate grid since the last tick"""
+        if self.signal_type != "Draw Input":
+            return
+        block = self.mouse_capture.read()
+        if block.size == 0:
+            return
+        self.push_input_samples(block)
+        if self.mouse_capture.newest_read_time is not None:
+            self.capture_markers.append((self.input_signal.write_index,
+                                         self.mouse_capture.newest_read_time))
+
+    def check_capture_latency(self):
+        """Record input-to-output latency for drawn events whose samples have been filtered"""
+        now = time.perf_counter()
+        while self.capture_markers and self.output_signal.write_index >= self.capture_markers[0][0]:
+            _, event_time = self.capture_markers.popleft()
+            self.mouse_capture.record_latency(now - event_time)
+
+    def update_capture_rate(self, rate):
+        """Change the rate drawn input is resampled to"""
+        if self.signal_generator is None:
+            # Samples already plotted were taken at the old rate; start the time axis afresh
+            self.reset_signal_buffers()
+        self.mouse_capture.set_sample_rate(rate)
+
+    def update_generator_rate(self, rate):
+        """Change the sample rate of generated sources"""
+        self.generator_rate = rate
+        if self.signal_generator is not None:
+            self.reset_signal_buffers()
+            self.fit_signal_buffers(rate)
+            self.signal_generator.sample_rate = float(rate)
+            self.generator_start = time.perf_counter()
+            self.generator_count = 0
+
+    def fit_signal_buffers(self, rate):
+        """Size the buffers for one second of input, the most a tick at the slowest DSP rate collects"""
+        max_samples = max(self.min_samples, int(np.ceil(rate)))
+        if max_samples != self.max_samples:
+            self.max_samples = max_samples
+            self.input_signal = RingBuffer(max_samples, self.input_channels)
+            self.output_signal = RingBuffer(max_samples, self.input_channels)
+
+    def input_rate(self):
+        """Sample rate of the active input source"""
+        if self.signal_generator is not None:
+            return self.signal_generator.sample_rate
+        return self.mouse_capture.sample_rate
+
+    def update_capture_label(self):
+        """Show the drawn input's rate, jitter and latency"""
+        stats = self.mouse_capture.stats()
+        self.capture_label.setText(
+            f"Events: {stats['event_rate']:.0f}/s, jitter {stats['jitter_ms']:.1f} ms | "
+            f"Latency p50 {stats['latency_p50_ms']:.1f} ms, p99 {stats['latency_p99_ms']:.1f} ms")
+
+    def sync_worker_design(self):
+        """Publish the compiled design to the worker after an edit"""
+        compiled = self.get_compiled_filter()
+        if compiled is self.worker_design:
+            return
+        self.worker_design = compiled
+        main_filter = compiled if (self.zeros or self.poles) else None
+        self.dsp_worker.set_design(main_filter, self.all_pass_library.compile(compiled.all_pass))
+
+    def closeEvent(self, event):
+        """Stop the DSP worker thread with the window"""
+        if self.dsp_worker is not None:
+            self.dsp_worker.stop()
+            self.dsp_worker.join(timeout=1.0)
+        super().closeEvent(event)
+
+    def invalidate_filter_cache(self, *args):
+        """Mark the compiled coefficients stale after a design edit"""
+        self.compiled_filter = None
+
+    def update_filter_form(self, direct):
+        """Remember the selected realization when the radio button changes"""
+        self.filter_form = 'direct' if direct else 'cascade'
+        self.invalidate_filter_cache()
+
+    def enabled_all_pass_indices(self):
+        """Indices of the all-pass filters currently checked in the library list"""
+        return self.enabled_all_pass
+
+    def update_enabled_all_pass(self, *args):
+        """Read the checked all-pass filters from the widgets after the user changes them"""
+        if not self.all_pass_enabled.isChecked():
+            enabled = ()
         else:
-            self.input_signal = self.input_signal[1:] + [y]
-        
-        self.last_y = event.y()
-        
-    def process_signal(self):
-        # Implement actual filter processing using difference equation
-        x = self.input_signal[-1]
-        
-        # Apply selected filter (Direct Form II or Cascade)
-        y = self.apply_selected_filter(x)
-        
-        # Apply selected all-pass filters
-        if self.all_pass_enabled:
-            y = self.apply_all_pass_filters(y)
-            
-        self.output_signal.append(y)
+            enabled = tuple(i for i in range(self.all_pass_list.count())
+                            if self.all_pass_list.item(i).checkState() == Qt.Checked)
+        if enabled != self.enabled_all_pass:
+            self.enabled_all_pass = enabled
+            self.invalidate_filter_cache()
+
+    def get_compiled_filter(self):
+        """Return coefficients for the current design, compiling them only after an edit"""
+        if self.compiled_filter is not None:
+            return self.compiled_filter
+
+        form = self.filter_form
+        all_pass = self.enabled_all_pass_indices()
+        key = design_key(self.zeros, self.poles, all_pass, form)
+
+        compiled = self.filter_cache.get(key)
+        if compiled is None:
+            # Profiled once the real-time tab has created the instrumentation
+            span = (self.instrumentation.span('coefficients')
+                    if self.instrumentation is not None else nullcontext())
+            with span:
+                if form == 'direct':
+                    coeffs = self.generate_direct_form_II()
+                    coeffs = {'b': np.asarray(coeffs['b']), 'a': np.asarray(coeffs['a'])}
+                else:
+                    coeffs = np.asarray(self.generate_cascade_form(), dtype=float)
+                compiled = CompiledFilter(key, form, coeffs, all_pass)
+
+            # Keep only the most recent designs (dicts preserve insertion order)
+            if len(self.filter_cache) >= self.max_cached_filters:
+                del self.filter_cache[next(iter(self.filter_cache))]
+            self.filter_cache[key] = compiled
+
+        self.compiled_filter = compiled
+        return compiled
 
     def apply_selected_filter(self, x):
-        """Apply filter with normalization"""
+        """Apply filter with normalization to a block of samples"""
+        x = np.atleast_1d(np.asarray(x, dtype=float))
         try:
             if len(self.zeros) == 0 and len(self.poles) == 0:
                 return x
-                
-            if self.direct_form.isChecked():
-                coeffs = self.generate_direct_form_II()
-                y = self.apply_direct_form(x, coeffs)
+
+            compiled = self.get_compiled_filter()
+            if compiled.form == 'direct':
+                y = self.apply_direct_form(x, compiled.coeffs)
             else:
-                coeffs = self.generate_cascade_form()
-                y = self.apply_cascade_form(x, coeffs)
-                
+                y = self.apply_cascade_form(x, compiled.coeffs)
+
             # Normalize output to prevent overflow
-            if abs(y) > 1.0:
-                y = y / abs(y)
-                
-            return float(y)
-                    
+            return np.clip(y, -1.0, 1.0)
+
         except Exception as e:
             print(f"Error applying filter: {e}")
             return x
 
     def apply_direct_form(self, x, coeffs):
+        """Apply Direct Form II implementation to a block of samples"""
         try:
-            # Convert coefficients to complex arrays
-            b = np.array(coeffs['b'], dtype=complex)
-            a = np.array(coeffs['a'], dtype=complex)
-            
-            state_size = max(len(b), len(a)) - 1
-            if self.direct_state is None or len(self.direct_state) != state_size:
-                self.direct_state = np.zeros(state_size, dtype=complex)
-                
-            # Direct Form II implementation
-            w = complex(x)  # Input to state
-            for i in range(1, len(a)):
-                w = w - a[i] * self.direct_state[i-1]
-                
-            y = b[0] * w  # Output computation
-            for i in range(1, len(b)):
-                y = y + b[i] * self.direct_state[i-1]
-                
-            # Update state correctly
-            self.direct_state = np.roll(self.direct_state, 1)
-            self.direct_state[0] = w
-            
-            # Return real part for output
-            return float(np.real(y))
+            self.filter_engine.set_direct_form(coeffs['b'], coeffs['a'])
+            return self.filter_engine.process_block(x)
 
         except Exception as e:
             print(f"Error applying Direct Form II: {e}")
@@ -1281,20 +1507,9 @@ class FilterDesignApp(QMainWindow):
             # Handle empty filter case
             if not self.zeros and not self.poles:
                 return {'b': [1.0], 'a': [1.0]}
-                
-            # Convert complex zeros/poles to polynomial coefficients
-            b = np.poly(self.zeros) if self.zeros else np.array([1.0])
-            a = np.poly(self.poles) if self.poles else np.array([1.0])
-            
-            # Keep as complex numbers
-            b = np.array(b, dtype=complex)
-            a = np.array(a, dtype=complex)
-            
-            # Normalize coefficients
-            if len(a) > 0:
-                b = b / a[0]
-                a = a / a[0]
-            
+
+            # Monic polynomials of the roots, kept complex and normalized so a[0] == 1
+            b, a = roots_to_direct_form(self.zeros, self.poles)
             return {
                 'b': b.tolist(),
                 'a': a.tolist()
@@ -1305,39 +1520,36 @@ class FilterDesignApp(QMainWindow):
             return {'b': [1.0], 'a': [1.0]}
 
     def apply_cascade_form(self, x, coeffs):
-        """Apply Cascade Form implementation"""
-        # Initialize state properly for each second-order section
-        if self.cascade_state is None or self.cascade_state.shape[0] != len(coeffs):
-            self.cascade_state = np.zeros((len(coeffs), 2))
-            
-        y = x
-        for i, section in enumerate(coeffs):
-            # Correct implementation of second-order section
-            w0 = y - section[4]*self.cascade_state[i,0] - section[5]*self.cascade_state[i,1]
-            y = section[0]*w0 + section[1]*self.cascade_state[i,0] + section[2]*self.cascade_state[i,1]
-            
-            # Update states correctly
-            self.cascade_state[i,1] = self.cascade_state[i,0]
-            self.cascade_state[i,0] = w0
-            
-        return y
+        """Apply Cascade Form implementation to a block of samples"""
+        self.filter_engine.set_cascade_form(coeffs)
+        return self.filter_engine.process_block(x)
 
     def apply_all_pass_filters(self, x):
-        """Process input through all enabled all-pass filters"""
-        y = x
+        """Process a block of samples through the compiled chain of enabled all-pass filters"""
         try:
-            if self.all_pass_enabled.isChecked():
-                for i in range(self.all_pass_list.count()):
-                    item = self.all_pass_list.item(i)
-                    if item.checkState() == Qt.Checked:
-                        filter = self.all_pass_library.get_filter(i)
-                        if filter:
-                            y = filter.process(y)
+            compiled = self.get_compiled_filter()
+            if compiled.all_pass != self.all_pass_chain.indices:
+                self.all_pass_chain = self.all_pass_library.compile(
+                    compiled.all_pass, previous=self.all_pass_chain)
+            return self.all_pass_chain.process_block(x)
         except Exception as e:
             print(f"Error in all-pass filtering: {e}")
+            return x
             
-        return y
-            
+    def render_signal_plots(self):
+        """Render timer tick: repaint only if new output arrived since the last frame"""
+        if self.output_signal.write_index == self.last_rendered_index:
+            return
+        self.last_rendered_index = self.output_signal.write_index
+        with self.instrumentation.span('render'):
+            self.update_signal_plots()
+        self.update_capture_label()
+
+    def update_render_rate(self, fps):
+        """Change how often the signal plots are repainted"""
+        self.render_fps = fps
+        self.render_timer.setInterval(int(1000 / fps))
+
     def update_signal_plots(self):
         """Update scrolling signal display"""
         if not self.input_signal or not self.output_signal:
@@ -1346,20 +1558,23 @@ class FilterDesignApp(QMainWindow):
         # Get window size
         window = self.window_spin.value()
         
-        # Get recent samples and ensure same length
-        input_data = np.array(list(self.input_signal)[-window:])
-        output_data = np.array(list(self.output_signal)[-window:])
-        
-        # Ensure both arrays have same length
-        min_len = min(len(input_data), len(output_data))
-        if min_len == 0:
+        # Input still being filtered has no output yet; line both plots up on the output
+        lag = self.input_signal.write_index - self.output_signal.write_index
+        lag = max(0, min(lag, len(self.input_signal)))
+
+        # Zero-copy views of the most recent samples, same length for both plots
+        min_len = min(window, len(self.input_signal) - lag, len(self.output_signal))
+        if min_len <= 0:
             return
-            
-        input_data = input_data[-min_len:]
-        output_data = output_data[-min_len:]
+
+        input_data = self.input_signal.latest(min_len + lag)[..., :min_len]
+        output_data = self.output_signal.latest(min_len)
+        if self.input_channels is not None:
+            # One curve per plot: multichannel streams show their first channel
+            input_data, output_data = input_data[0], output_data[0]
         
-        # Create time axis in seconds
-        dt = 1.0 / self.processing_speed
+        # Time axis in seconds at the active source's rate
+        dt = 1.0 / self.input_rate()
         t = np.arange(min_len) * dt
         
         # Update plots
@@ -1370,6 +1585,12 @@ class FilterDesignApp(QMainWindow):
     def export_filter(self):
         """Export filter realization diagram"""
         try:
+            # pyplot is only needed for exported diagrams
+            global plt
+            _t = time.perf_counter()
+            import matplotlib.pyplot as plt
+            STARTUP_TIMER.record("import pyplot", _t)
+
             # Create new figure for block diagram
             fig = plt.figure(figsize=(12, 8))
             
@@ -1563,31 +1784,20 @@ class FilterDesignApp(QMainWindow):
     def generate_cascade_form(self):
         """Convert zeros and poles to cascade form coefficients"""
         try:
-            # Get transfer function coefficients
-            b = np.poly(self.zeros)
-            a = np.poly(self.poles)
-            
-            # Convert to second-order sections
-            sos = tf2sos(b, a, pairing='nearest')
-            return sos.tolist()
+            # Transfer function coefficients converted to second-order sections
+            return roots_to_sections(self.zeros, self.poles).tolist()
         except Exception as e:
             print(f"Error generating cascade form: {e}")
             return np.array([[1, 0, 0, 1, 0, 0]]).tolist()
 
     
     def add_to_history(self):
-        # Remove any redo states
-        while len(self.history) > self.history_index + 1:
-            self.history.pop()
-        
-        # Add current state
-        state = {
-            'zeros': self.zeros.copy(),
-            'poles': self.poles.copy(),
+        # Records only the roots/coefficients that changed; drops any redo states
+        self.history.record({
+            'zeros': self.zeros,
+            'poles': self.poles,
             'all_pass': [f.a for f in self.all_pass_filters]
-        }
-        self.history.append(state)
-        self.history_index += 1
+        })
 
     def setup_all_pass_panel(self):
         """Add panel for all-pass filter configuration and library"""
@@ -1597,6 +1807,8 @@ class FilterDesignApp(QMainWindow):
         # Enable/disable all-pass filters
         self.all_pass_enabled = QCheckBox("Enable All-Pass Filters")
         self.all_pass_enabled.setStyleSheet(f"color: {TEXT_COLOR};")
+        # Connected first so every later handler sees the new enabled set
+        self.all_pass_enabled.stateChanged.connect(self.update_enabled_all_pass)
         self.all_pass_enabled.stateChanged.connect(self.on_all_pass_enabled)
         
         # Library list with checkable items
@@ -1608,6 +1820,7 @@ class FilterDesignApp(QMainWindow):
                 border: 1px solid {ACCENT_COLOR};
             }}
         """)
+        self.all_pass_list.itemChanged.connect(self.update_enabled_all_pass)
         self.all_pass_list.itemChanged.connect(self.update_frequency_response)
         self.all_pass_enabled.stateChanged.connect(self.update_frequency_response)
         # Add default filters to list
@@ -1690,31 +1903,81 @@ class FilterDesignApp(QMainWindow):
     
     def setup_signal_panel(self):
         """Setup real-time signal processing panel"""
+        # pyqtgraph is only needed for the real-time plots
+        global pg
+        _t = time.perf_counter()
+        import pyqtgraph as pg
+        pg.setConfigOptions(antialias=True)
+        STARTUP_TIMER.record("import pyqtgraph", _t)
+
         panel = QGroupBox("Real-time Processing")
         layout = QVBoxLayout()
 
-        # Speed control with finer granularity
+        # How often pending input is filtered; each tick filters everything that arrived since
         speed_layout = QHBoxLayout()
         self.speed_slider = QSlider(Qt.Horizontal)
-        self.speed_slider.setRange(1, 100)  # 1-100 points/sec
-        self.speed_slider.setValue(10)  # Default 10 pts/sec
+        self.speed_slider.setRange(1, 100)  # 1-100 ticks/sec
+        self.speed_slider.setValue(self.dsp_rate)
         
-        self.speed_label = QLabel("10 pts/sec")
-        self.speed_slider.valueChanged.connect(self.update_processing_speed)
+        self.speed_label = QLabel(f"{self.dsp_rate} ticks/sec")
+        self.speed_slider.valueChanged.connect(self.update_dsp_rate)
         
-        speed_layout.addWidget(QLabel("Processing Speed:"))
+        speed_layout.addWidget(QLabel("DSP Tick Rate:"))
         speed_layout.addWidget(self.speed_slider)
         speed_layout.addWidget(self.speed_label)
 
         # Window size control
         window_layout = QHBoxLayout()
         self.window_spin = QSpinBox()
-        self.window_spin.setRange(100, 1000)
+        self.window_spin.setRange(100, self.min_samples)
         self.window_spin.setValue(200)
         self.window_spin.setSingleStep(50)
         window_layout.addWidget(QLabel("View Window (pts):"))
         window_layout.addWidget(self.window_spin)
 
+        # Display refresh rate, independent of the processing speed
+        self.fps_spin = QSpinBox()
+        self.fps_spin.setRange(1, 120)
+        self.fps_spin.setValue(self.render_fps)
+        self.fps_spin.valueChanged.connect(self.update_render_rate)
+        window_layout.addWidget(QLabel("Display Rate (fps):"))
+        window_layout.addWidget(self.fps_spin)
+
+        # Drawn input is resampled to the draw rate before filtering; sources have their own rate
+        capture_layout = QHBoxLayout()
+        self.capture_rate_spin = QSpinBox()
+        self.capture_rate_spin.setRange(10, 2000)
+        self.capture_rate_spin.setValue(int(self.mouse_capture.sample_rate))
+        self.capture_rate_spin.setSingleStep(10)
+        self.capture_rate_spin.valueChanged.connect(self.update_capture_rate)
+        self.generator_rate_spin = QSpinBox()
+        self.generator_rate_spin.setRange(10, 96000)  # Up to audio rates (44.1/48/96 kHz)
+        self.generator_rate_spin.setValue(self.generator_rate)
+        self.generator_rate_spin.setSingleStep(100)
+        self.generator_rate_spin.valueChanged.connect(self.update_generator_rate)
+        self.capture_label = QLabel()
+        self.signal_combo = QComboBox()
+        self.signal_combo.addItems(["Draw Input"] + list(SIGNAL_SOURCES))
+        self.signal_combo.currentTextChanged.connect(self.change_signal_type)
+        capture_layout.addWidget(QLabel("Input:"))
+        capture_layout.addWidget(self.signal_combo)
+        capture_layout.addWidget(QLabel("Draw Rate (Hz):"))
+        capture_layout.addWidget(self.capture_rate_spin)
+        capture_layout.addWidget(QLabel("Source Rate (Hz):"))
+        capture_layout.addWidget(self.generator_rate_spin)
+        capture_layout.addWidget(self.capture_label)
+        capture_layout.addStretch()
+
+        # Opt-in profiling of the processing chain
+        stats_layout = QHBoxLayout()
+        self.stats_check = QCheckBox("Show Stats")
+        self.stats_check.toggled.connect(self.toggle_stats)
+        export_stats_btn = QPushButton("Export Stats")
+        export_stats_btn.clicked.connect(self.export_stats)
+        stats_layout.addWidget(self.stats_check)
+        stats_layout.addWidget(export_stats_btn)
+        stats_layout.addStretch()
+
         # Drawing area with coordinate display
         self.draw_area = QWidget()
         self.draw_area.setMinimumSize(300, 100)
@@ -1751,10 +2014,28 @@ class FilterDesignApp(QMainWindow):
         # Add curves with synchronized updates
         self.input_curve = self.input_plot.plot(pen='y')
         self.output_curve = self.output_plot.plot(pen='c')
+
+        # Stats overlay drawn over the input plot while profiling is on
+        self.stats_overlay = QLabel(self.input_plot)
+        self.stats_overlay.setStyleSheet(f"""
+            QLabel {{
+                background-color: rgba(30, 30, 30, 200);
+                color: {TEXT_COLOR};
+                border: 1px solid {ACCENT_COLOR};
+                font-family: monospace;
+                padding: 4px;
+            }}
+        """)
+        self.stats_overlay.move(60, 30)
+        self.stats_overlay.hide()
+        self.stats_timer = QTimer()
+        self.stats_timer.timeout.connect(self.update_stats_overlay)
         
         # Add widgets to layout
         layout.addLayout(speed_layout)
         layout.addLayout(window_layout)
+        layout.addLayout(capture_layout)
+        layout.addLayout(stats_layout)
         layout.addWidget(self.draw_area)
         layout.addWidget(self.input_plot)
         layout.addWidget(self.output_plot)
@@ -1765,33 +2046,32 @@ class FilterDesignApp(QMainWindow):
     def change_signal_type(self, signal_type):
         """Change input signal generation method"""
         self.signal_type = signal_type
-        self.input_signal.clear()
-        self.output_signal.clear()
-        
-        if signal_type != "Draw Input":
-            # Start automated signal generation
-            self.signal_timer = QTimer()
-            self.signal_timer.timeout.connect(self.generate_signal)
+        self.signal_timer.stop()
+        self.reset_signal_buffers()
+        self.mouse_capture.clear()
+        
+        if signal_type in SIGNAL_SOURCES:
+            # Start automated signal generation at the generator rate
+            kind, params = SIGNAL_SOURCES[signal_type]
+            self.signal_generator = BlockSignalGenerator(
+                kind, sample_rate=self.generator_rate, **params)
+            self.generator_start = time.perf_counter()
+            self.generator_count = 0
             self.signal_timer.start(20)
         else:
-            if hasattr(self, 'signal_timer'):
-                self.signal_timer.stop()
+            self.signal_generator = None
+        self.fit_signal_buffers(self.input_rate())
 
     def generate_signal(self):
-        """Generate selected signal type"""
-        t = len(self.input_signal) * 0.02  # Time based on sample count
-        
-        if self.signal_type == "Sine Wave":
-            y = np.sin(2 * np.pi * 1.0 * t)  # 1 Hz sine wave
-        elif self.signal_type == "Square Wave":
-            y = np.sign(np.sin(2 * np.pi * 0.5 * t))  # 0.5 Hz square wave
-        elif self.signal_type == "Noise":
-            y = np.random.uniform(-1, 1)
-        else:
+        """Generate every sample of the selected source that has come due since the last tick"""
+        if self.signal_generator is None:
             return
-            
-        self.input_signal.append(float(y))
-        self.process_next_sample()
+        due = int((time.perf_counter() - self.generator_start) * self.signal_generator.sample_rate)
+        n = due - self.generator_count
+        if n <= 0:
+            return
+        self.generator_count = due
+        self.push_input_samples(self.signal_generator.generate(n))
 
     def eventFilter(self, obj, event):
         """Handle mouse events in drawing area"""
@@ -1801,27 +2081,76 @@ class FilterDesignApp(QMainWindow):
                 return True
         return super().eventFilter(obj, event)
 
-    def update_processing_speed(self, value):
-        """Update processing speed and display"""
-        self.processing_speed = value
-        self.speed_label.setText(f"{value} pts/sec")
+    def update_dsp_rate(self, value):
+        """Change how often the DSP timer filters pending input; the input rate is unaffected"""
+        self.dsp_rate = value
+        self.speed_label.setText(f"{value} ticks/sec")
         
         # Update timer interval (ms)
         interval = int(1000 / value)
         self.process_timer.setInterval(interval)
-        
-        # Clear old data
-        self.reset_signal_buffers()
+
+    def reset_signal_buffers(self):
+        """Clear the input/output buffers and any input still waiting to be filtered"""
+        # Discarded on purpose, so not counted as dropped
+        self.pending_input.clear()
+        self.capture_markers.clear()
+        if self.dsp_worker is not None:
+            self.dsp_worker.reset()  # Drop queued input and output, start from clear state
+        else:
+            self.filter_engine.reset()
+            self.all_pass_chain.reset()
+        self.input_signal.clear()
+        self.output_signal.clear()
+        self.last_rendered_index = -1
+
+    def toggle_stats(self, enabled):
+        """Start or stop profiling the processing chain"""
+        if enabled:
+            self.instrumentation.reset()
+        self.instrumentation.enabled = enabled
+        self.stats_overlay.setVisible(enabled)
+        if enabled:
+            self.update_stats_overlay()
+            self.stats_timer.start(500)
+        else:
+            self.stats_timer.stop()
+
+    def update_stats_overlay(self):
+        """Refresh the stats overlay text"""
+        self.stats_overlay.setText(self.instrumentation.summary_text())
+        self.stats_overlay.adjustSize()
+        self.stats_overlay.raise_()
+
+    def export_stats(self):
+        """Save the current profiling statistics as JSON"""
+        filename, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Stats",
+            "",
+            "JSON Files (*.json)"
+        )
+        if not filename:
+            return
+        if not filename.endswith('.json'):
+            filename += '.json'
+        try:
+            self.instrumentation.export_json(filename)
+        except OSError as e:
+            QMessageBox.critical(self, "Export Error", f"Failed to export stats: {str(e)}")
 
     def handle_mouse_draw(self, event):
-        """Generate input signal from mouse movement"""
+        """Capture a timestamped input value from mouse movement"""
+        if self.signal_type != "Draw Input":
+            return
+        now = time.perf_counter()
         if not hasattr(self, 'last_pos'):
             self.last_pos = event.pos()
-            self.last_time = time.time()
+            self.last_time = now
             return
             
         # Calculate mouse velocity 
-        dt = time.time() - self.last_time
+        dt = max(now - self.last_time, 1e-6)
         dx = event.pos().x() - self.last_pos.x()
         dy = event.pos().y() - self.last_pos.y()
         velocity = np.sqrt(dx*dx + dy*dy) / dt
@@ -1834,116 +2163,105 @@ class FilterDesignApp(QMainWindow):
             freq = min(20, velocity / 100)  # Cap max frequency
             y *= np.sin(2 * np.pi * freq * dt)
         
-        self.input_signal.append(float(y))
+        # Resampled to the fixed draw rate on the next processing tick
+        self.mouse_capture.add(y, now)
         
         # Update state
         self.last_pos = event.pos()
-        self.last_time = time.time()
-        
-        self.process_next_sample()
-    
-    def process_all_pass(self, x):
-        """Apply enabled all-pass filters to input sample"""
-        y = x
-        # Check if checkbox exists and is enabled
-        if not hasattr(self, 'all_pass_enabled') or not self.all_pass_enabled.isChecked():
-            return y
-            
-        # Loop through enabled filters in list
-        for i in range(self.all_pass_list.count()):
-            item = self.all_pass_list.item(i)
-            if item and item.checkState() == Qt.Checked:
-                filter = self.all_pass_library.get_filter(i)
-                if filter:
-                    y = filter.process(y)
-                    
-        return y
+        self.last_time = now
     
     def update_visualization(self):
         """Update signal visualization with new window size"""
         self.update_signal_plots()
 
 
-class AllPassFilter:
+class RedrawScheduler:
     """
-    All-pass filter implementation with unity magnitude response.
-    
-    Properties:
-    - Magnitude response = 1 at all frequencies
-    - Phase response varies with frequency
-    - Used for phase correction without affecting magnitude
-    
-    Attributes:
-        a (float): Filter coefficient (0 < a < 1)
-        zero (float): Zero location (outside unit circle)
-        pole (float): Pole location (inside unit circle)
-        state (float): Filter state for real-time processing
-    """
-    def __init__(self, a):
-        self.a = float(a)  # Coefficient
-        self.zero = 1/self.a  # Reciprocal location (outside unit circle)
-        self.pole = self.a   # Inside unit circle
-        self.state = 0.0
-        
-    def process(self, x):
-        """Process one sample through all-pass filter"""
-        try:
-            # Direct Form I implementation
-            w = x - self.pole * self.state
-            y = self.zero * w + self.state
-            self.state = w  # Update state
-            return y
-        except Exception as e:
-            print(f"Error in filter: {e}")
-            return x
+    Coalesces redraw requests into at most one repaint per frame.
 
-class AllPassLibrary:
-    """
-    Library of common all-pass filter configurations.
-    
-    Features:
-    - Predefined coefficients for common phase corrections
-    - Dynamic addition of custom filters
-    - Named filter access
-    
-    Default coefficients:
-    - 0.5: 90° phase shift at π/3
-    - 0.7: 90° phase shift at π/2
-    - 0.9: 90° phase shift at 2π/3
-    - 0.95: Sharper phase transition
-    - 0.98: Very sharp phase transition
-    """
+    Requests are keyed by name; a request for a name that is already pending
+    replaces it (latest state wins) and counts as a dropped update. Pending
+    callbacks run together from a single-shot QTimer once the frame interval
+    since the last repaint has elapsed.
 
-    def __init__(self):
-        self.filters = []
-        self.initialize_library()
-    
-    def initialize_library(self):
-        """Initialize with common all-pass filter coefficients"""
-        default_coeffs = [0.5, 0.7, 0.9, 0.95, 0.98]
-        for a in default_coeffs:
-            self.filters.append(AllPassFilter(a))
-            
-    def get_filter(self, idx):
-        """Get filter by index"""
-        if 0 <= idx < len(self.filters):
-            return self.filters[idx]
-        return None
-        
-    def get_filter_names(self):
-        """Get list of filter names"""
-        return [f'a={f.a:.3f}' for f in self.filters]
-        
-    def add_filter(self, a):
-        """Add new filter with coefficient a"""
-        if 0 <= a <= 1:
-            self.filters.append(AllPassFilter(a))
-            return True
-        return False
+    Attributes:
+        frame_interval_ms (int): Minimum time between repaints
+        requested (int): Redraw requests received
+        dropped (int): Requests coalesced into an already pending repaint
+        frames (int): Repaints performed
+    """
+    def __init__(self, frame_interval_ms=16):
+        self.frame_interval_ms = frame_interval_ms
+        self.pending = {}
+        self.requested = 0
+        self.dropped = 0
+        self.frames = 0
+        self.last_frame = 0.0
+        self.frame_times = deque(maxlen=60)
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+
+    def request(self, name, callback):
+        """Queue callback under name for the next frame"""
+        self.requested += 1
+        if name in self.pending:
+            self.dropped += 1
+        self.pending[name] = callback
+
+        if not self.timer.isActive():
+            elapsed_ms = (time.perf_counter() - self.last_frame) * 1000
+            self.timer.start(max(0, int(self.frame_interval_ms - elapsed_ms)))
+
+    def flush(self):
+        """Run every pending callback now"""
+        self.timer.stop()
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, {}
+        for callback in pending.values():
+            callback()
+
+        self.last_frame = time.perf_counter()
+        self.frame_times.append(self.last_frame)
+        self.frames += 1
+
+    def fps(self):
+        """Achieved repaint rate over the recent frames"""
+        if len(self.frame_times) < 2:
+            return 0.0
+        span = self.frame_times[-1] - self.frame_times[0]
+        return (len(self.frame_times) - 1) / span if span > 0 else 0.0
+
+    def reset_stats(self):
+        """Start a new measurement window (e.g. at the start of a drag)"""
+        self.requested = 0
+        self.dropped = 0
+        self.frames = 0
+        self.frame_times.clear()
+
+    def stats(self):
+        """Instrumentation counters for the redraw loop"""
+        return {
+            'fps': self.fps(),
+            'frames': self.frames,
+            'requested': self.requested,
+            'dropped': self.dropped,
+        }
 
 
 if __name__ == '__main__':
+    if '--startup-timing' in sys.argv:
+        sys.argv.remove('--startup-timing')
+        STARTUP_TIMER.enabled = True
+
+    _t = time.perf_counter()
     app = QApplication(sys.argv)
+    _t = STARTUP_TIMER.record("QApplication", _t)
     window = FilterDesignApp()
+    _t = STARTUP_TIMER.record("FilterDesignApp()", _t)
     window.show()
+    STARTUP_TIMER.record("window.show()", _t)
+    QTimer.singleShot(0, STARTUP_TIMER.report)
     sys.exit(app.exec_())
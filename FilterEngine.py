@@ -0,0 +1,454 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import signal
+
+
+def design_key(zeros, poles, all_pass=(), form='direct'):
+    """
+    Hashable key identifying a pole/zero design, its enabled all-pass set and implementation form.
+
+    The tuple itself is used as the cache key rather than its hash(), so two
+    designs whose hashes collide are still told apart by dict equality.
+    """
+    return (tuple(complex(z) for z in zeros),
+            tuple(complex(p) for p in poles),
+            tuple(all_pass),
+            form)
+
+
+class CompiledFilter:
+    """
+    Filter coefficients compiled once from a pole/zero design.
+
+    Attributes:
+        key (tuple): design_key() of the design the coefficients were built from
+        form (str): 'direct' or 'cascade'
+        coeffs: {'b': ndarray, 'a': ndarray} for the direct form,
+                (n_sections, 6) ndarray for the cascade form
+        all_pass (tuple): Indices of the all-pass filters enabled for this design
+    """
+    def __init__(self, key, form, coeffs, all_pass=()):
+        self.key = key
+        self.form = form
+        self.coeffs = coeffs
+        self.all_pass = tuple(all_pass)
+
+
+def realize_coefficients(c, tol=1e-9):
+    """
+    Return coefficients as float64 when their imaginary part is rounding noise.
+
+    A conjugate-symmetric design expands to real polynomials, so only designs
+    that are not realizable (a complex root without its conjugate) stay complex.
+    """
+    c = np.atleast_1d(np.asarray(c))
+    if np.iscomplexobj(c):
+        if np.all(np.abs(c.imag) <= tol * max(1.0, np.max(np.abs(c)))):
+            return np.ascontiguousarray(c.real, dtype=np.float64)
+        return np.ascontiguousarray(c, dtype=np.complex128)
+    return np.ascontiguousarray(c, dtype=np.float64)
+
+
+class FilterEngine:
+    """
+    Block-based filtering engine for the real-time pipeline.
+
+    Filters whole chunks of samples at once instead of one sample per call.
+    The filter state is carried between blocks, so feeding a signal in
+    consecutive chunks gives the same output as filtering it in one go.
+
+    Blocks are either 1-D (one signal) or (channels, samples). Every channel is
+    filtered with the same design in one vectorized call along the last axis,
+    each with its own state. A change in the channel count starts a new
+    stream with cleared state.
+
+    The direct form runs a Direct Form II transposed kernel (lfilter) on real
+    float64 coefficients; complex coefficients are only used for designs that
+    are not realizable. The cascade form runs sosfilt with a persistent
+    (n_sections, channels, 2) state that is warm-restarted when the sections
+    change.
+
+    Direct form designs with no poles outside the origin are FIR. From
+    fir_fft_min_taps taps up they are filtered by overlap-save FFT convolution
+    against cached spectra of the taps, carrying the last len(taps) - 1 input
+    samples between blocks instead of a recursive state.
+
+    Attributes:
+        form (str): 'direct' (Direct Form II transposed) or 'cascade' (sosfilt)
+        b, a (ndarray): Transfer function coefficients for the direct form
+        sos (ndarray): Second-order sections for the cascade form
+        channels (int): Number of signals filtered side by side
+        direct_zi (ndarray): Preallocated direct form state, shape (channels, order)
+        cascade_zi (ndarray): Persistent cascade form state, shape
+            (n_sections, channels, 2) as sosfilt expects
+        last_input (ndarray): Last sample of each channel, used for warm restarts
+        fir_taps (ndarray): Real FIR taps when the FFT path is active, else None
+        fir_history (ndarray): Last len(fir_taps) - 1 input samples, shape (channels, taps - 1)
+    """
+    # FIR designs with at least this many taps use overlap-save convolution
+    fir_fft_min_taps = 64
+
+    def __init__(self):
+        self.form = 'direct'
+        self.b = np.array([1.0])
+        self.a = np.array([1.0])
+        self.sos = np.array([[1.0, 0.0, 0.0, 1.0, 0.0, 0.0]])
+        self.channels = 1
+        self.direct_zi = np.zeros((1, 0))
+        self.direct_source = None
+        self.cascade_zi = np.zeros((1, 1, 2))
+        self.cascade_source = None
+        self.last_input = np.zeros(1)
+        self.fir_taps = None
+        self.fir_history = np.zeros((1, 0))
+        self.fir_spectra = {}
+
+    def set_direct_form(self, b, a):
+        """Use transfer function coefficients, keeping state if the order is unchanged"""
+        # Same coefficient arrays as last block (compiled design unchanged)
+        if (self.form == 'direct' and self.direct_source is not None
+                and self.direct_source[0] is b and self.direct_source[1] is a):
+            return
+        self.direct_source = (b, a)
+        b = realize_coefficients(b)
+        a = realize_coefficients(a)
+        if np.iscomplexobj(b) != np.iscomplexobj(a):
+            b = b.astype(np.complex128)
+            a = a.astype(np.complex128)
+
+        # Normalize so the kernel can assume a[0] == 1
+        b = b / a[0]
+        a = a / a[0]
+
+        # All poles at the origin: a is [1, 0, ..., 0] and only b matters
+        if len(b) >= self.fir_fft_min_taps and not np.any(a[1:]):
+            self.set_fir_taps(b)
+            self.form = 'direct'
+            self.b = b
+            self.a = a
+            return
+        self.fir_taps = None
+
+        order = max(len(b), len(a)) - 1
+        if (self.form != 'direct' or self.direct_zi.shape != (self.channels, order)
+                or self.direct_zi.dtype != b.dtype):
+            self.direct_zi = np.zeros((self.channels, order), dtype=b.dtype)
+        self.form = 'direct'
+        self.b = b
+        self.a = a
+
+    def set_fir_taps(self, b):
+        """Switch to overlap-save filtering, keeping the input history if the length is unchanged"""
+        # The output is the real part, and for a real input that is the convolution with real(b)
+        taps = np.ascontiguousarray(np.real(b), dtype=np.float64)
+        if self.fir_taps is None or len(self.fir_taps) != len(taps):
+            self.fir_history = np.zeros((self.channels, len(taps) - 1))
+        self.fir_taps = taps
+        self.fir_spectra = {}
+
+    def set_cascade_form(self, sos):
+        """Use second-order sections, warm-restarting the state when they change"""
+        if self.form == 'cascade' and self.cascade_source is sos:
+            return
+        self.cascade_source = sos
+        sos = np.atleast_2d(np.asarray(sos, dtype=float))
+        self.form = 'cascade'
+        self.sos = sos
+        self.warm_restart_cascade()
+
+    def warm_restart_cascade(self):
+        """
+        Set the cascade state to the steady state for the last input sample.
+
+        Like sosfilt_zi, this assumes the input has been held at its last value,
+        so a coefficient edit mid-stream does not start from an empty state and
+        ring with a step transient.
+        """
+        shape = (self.sos.shape[0], self.channels, 2)
+        try:
+            zi = signal.sosfilt_zi(self.sos)[:, None, :] * self.last_input[None, :, None]
+        except (ValueError, np.linalg.LinAlgError):
+            zi = np.zeros(shape)
+        if not np.all(np.isfinite(zi)):
+            zi = np.zeros(shape)
+
+        if self.cascade_zi is not None and self.cascade_zi.shape == zi.shape:
+            self.cascade_zi[...] = zi
+        else:
+            self.cascade_zi = zi
+
+    def set_channels(self, channels):
+        """Filter a different number of channels, starting each from a cleared state"""
+        self.channels = channels
+        self.direct_zi = np.zeros((channels, self.direct_zi.shape[-1]), dtype=self.direct_zi.dtype)
+        self.fir_history = np.zeros((channels, self.fir_history.shape[-1]))
+        self.cascade_zi = np.zeros((self.sos.shape[0], channels, 2))
+        self.last_input = np.zeros(channels)
+
+    def reset(self):
+        """Clear the carried filter state"""
+        self.direct_zi[...] = 0
+        self.fir_history[...] = 0
+        self.cascade_zi = np.zeros((self.sos.shape[0], self.channels, 2))
+        self.last_input = np.zeros(self.channels)
+
+    def process_block(self, x):
+        """Filter a (samples,) or (channels, samples) block, continuing from the previous block"""
+        x = np.asarray(x, dtype=float)
+        if x.size == 0:
+            return x
+        signals = x.reshape(1, -1) if x.ndim == 1 else x
+        if signals.shape[0] != self.channels:
+            self.set_channels(signals.shape[0])
+
+        if self.form == 'cascade':
+            y = self.process_cascade(signals)
+        else:
+            y = self.process_direct(signals)
+        self.last_input = signals[:, -1].copy()
+        return y.reshape(x.shape)
+
+    def process_cascade(self, x):
+        """Second-order section cascade over a whole (channels, samples) block"""
+        y, zf = signal.sosfilt(self.sos, x, axis=-1, zi=self.cascade_zi)
+        self.cascade_zi[...] = zf
+        return y
+
+    def process_direct(self, x):
+        """Direct Form II transposed kernel over a whole (channels, samples) block"""
+        if self.fir_taps is not None:
+            return self.process_fir(x)
+        if self.direct_zi.shape[-1] == 0:
+            return x * np.real(self.b[0])
+
+        y, zf = signal.lfilter(self.b, self.a, x, axis=-1, zi=self.direct_zi)
+        self.direct_zi[...] = zf
+        # Non-realizable designs keep the real part as output
+        return np.real(y)
+
+    def process_fir(self, x):
+        """FIR convolution continuing from the carried input history"""
+        taps = self.fir_taps
+        n = x.shape[-1]
+        buf = np.concatenate((self.fir_history, x), axis=-1)
+        if n < len(taps):
+            # Short real-time blocks: a direct dot product per sample is cheaper than an FFT
+            y = sliding_window_view(buf, len(taps), axis=-1) @ taps[::-1]
+        else:
+            y = self.overlap_save(buf, n)
+        self.fir_history = buf[:, n:].copy()
+        return y
+
+    def overlap_save(self, buf, n):
+        """Convolve n new samples per channel (buf starts with len(taps) - 1 history samples) by FFT"""
+        m = len(self.fir_taps)
+        # Frames of about 4x the taps keep most of each FFT as valid output
+        nfft = min(1 << (4 * m - 1).bit_length(), 1 << (n + m - 2).bit_length())
+        hop = nfft - m + 1
+        n_frames = -(-n // hop)
+
+        spectrum = self.fir_spectra.get(nfft)
+        if spectrum is None:
+            spectrum = self.fir_spectra[nfft] = np.fft.rfft(self.fir_taps, nfft)
+
+        channels = buf.shape[0]
+        padded = np.zeros((channels, n_frames * hop + m - 1))
+        padded[:, :buf.shape[-1]] = buf
+        frames = sliding_window_view(padded, nfft, axis=-1)[:, ::hop]
+        out = np.fft.irfft(np.fft.rfft(frames, axis=-1) * spectrum, nfft, axis=-1)
+        # The first m - 1 samples of each frame are wrapped around and discarded
+        return out[:, :, m - 1:].reshape(channels, -1)[:, :n]
+
+
+class AllPassFilter:
+    """
+    All-pass filter implementation with unity magnitude response.
+    
+    Properties:
+    - Magnitude response = 1 at all frequencies
+    - Phase response varies with frequency
+    - Used for phase correction without affecting magnitude
+    
+    Attributes:
+        a (float): Filter coefficient (0 < a < 1)
+        zero (float): Zero location (outside unit circle)
+        pole (float): Pole location (inside unit circle)
+        state (float): Filter state for real-time processing
+    """
+    def __init__(self, a):
+        self.a = float(a)  # Coefficient
+        self.zero = 1/self.a  # Reciprocal location (outside unit circle)
+        self.pole = self.a   # Inside unit circle
+        self.state = 0.0
+        
+    def process(self, x):
+        """Process one sample through all-pass filter"""
+        try:
+            # Direct Form I implementation
+            w = x - self.pole * self.state
+            y = self.zero * w + self.state
+            self.state = w  # Update state
+            return y
+        except Exception as e:
+            print(f"Error in filter: {e}")
+            return x
+
+class AllPassLibrary:
+    """
+    Library of common all-pass filter configurations.
+    
+    Features:
+    - Predefined coefficients for common phase corrections
+    - Dynamic addition of custom filters
+    - Named filter access
+    - Compilation of enabled filters into one AllPassChain for block processing
+    
+    Default coefficients:
+    - 0.5: 90° phase shift at π/3
+    - 0.7: 90° phase shift at π/2
+    - 0.9: 90° phase shift at 2π/3
+    - 0.95: Sharper phase transition
+    - 0.98: Very sharp phase transition
+    """
+
+    def __init__(self):
+        self.filters = []
+        self.initialize_library()
+    
+    def initialize_library(self):
+        """Initialize with common all-pass filter coefficients"""
+        default_coeffs = [0.5, 0.7, 0.9, 0.95, 0.98]
+        for a in default_coeffs:
+            self.filters.append(AllPassFilter(a))
+            
+    def get_filter(self, idx):
+        """Get filter by index"""
+        if 0 <= idx < len(self.filters):
+            return self.filters[idx]
+        return None
+        
+    def get_filter_names(self):
+        """Get list of filter names"""
+        return [f'a={f.a:.3f}' for f in self.filters]
+        
+    def add_filter(self, a):
+        """Add new filter with coefficient a"""
+        if 0 <= a <= 1:
+            self.filters.append(AllPassFilter(a))
+            return True
+        return False
+
+    def compile(self, indices, previous=None):
+        """Compile the filters at the given indices into one AllPassChain"""
+        indices = tuple(i for i in indices if 0 <= i < len(self.filters))
+        chain = AllPassChain(indices, [self.filters[i] for i in indices])
+        chain.carry_state_from(previous)
+        return chain
+
+
+class AllPassChain:
+    """
+    Enabled all-pass filters compiled into one cascade of first-order sections.
+
+    Each AllPassFilter becomes one sosfilt row [zero, 1, 0, 1, pole, 0], so the
+    whole chain is filtered in a single call per block. Row i of the state
+    array belongs to the filter at indices[i]. Like FilterEngine, blocks may be
+    (channels, samples) with separate state per channel.
+
+    Attributes:
+        indices (tuple): Library indices of the compiled filters
+        sos (ndarray): First-order sections, shape (n_filters, 6)
+        channels (int): Number of signals filtered side by side
+        zi (ndarray): Per-filter state, shape (n_filters, channels, 2)
+    """
+    def __init__(self, indices=(), filters=()):
+        self.indices = tuple(indices)
+        self.sos = np.array([[f.zero, 1.0, 0.0, 1.0, f.pole, 0.0] for f in filters],
+                            dtype=float).reshape(-1, 6)
+        self.set_channels(1)
+
+    def set_channels(self, channels):
+        """Filter a different number of channels, starting each from a cleared state"""
+        self.channels = channels
+        self.zi = np.zeros((len(self.indices), channels, 2))
+
+    def carry_state_from(self, previous):
+        """Keep the state of filters that were already enabled in a previous chain"""
+        if previous is None:
+            return
+        if previous.channels != self.channels:
+            self.set_channels(previous.channels)
+        rows = {idx: row for row, idx in enumerate(previous.indices)}
+        for row, idx in enumerate(self.indices):
+            if idx in rows:
+                self.zi[row] = previous.zi[rows[idx]]
+
+    def reset(self):
+        """Clear the state of every filter in the chain"""
+        self.zi[...] = 0
+
+    def process_block(self, x):
+        """Filter a block of samples through the whole chain"""
+        x = np.asarray(x, dtype=float)
+        if len(self.indices) == 0 or x.size == 0:
+            return x
+        signals = x.reshape(1, -1) if x.ndim == 1 else x
+        if signals.shape[0] != self.channels:
+            self.set_channels(signals.shape[0])
+        y, zf = signal.sosfilt(self.sos, signals, axis=-1, zi=self.zi)
+        self.zi[...] = zf
+        return y.reshape(x.shape)
+
+
+class DesignFilter:
+    """
+    Complete filter for one stream: compiled main filter followed by an all-pass chain.
+
+    Used where a design has to be applied to a signal outside the real-time
+    tab, such as offline file filtering. Accepts the same 1-D or
+    (channels, samples) blocks as FilterEngine.
+    """
+    def __init__(self, compiled=None, all_pass_chain=None, clip=False):
+        self.compiled = compiled
+        self.engine = FilterEngine()
+        self.all_pass_chain = all_pass_chain if all_pass_chain is not None else AllPassChain()
+        self.clip = clip
+        if compiled is not None:
+            if compiled.form == 'direct':
+                self.engine.set_direct_form(compiled.coeffs['b'], compiled.coeffs['a'])
+            else:
+                self.engine.set_cascade_form(compiled.coeffs)
+
+    def process_block(self, x):
+        """Filter a block of samples, continuing from the previous block"""
+        y = np.asarray(x, dtype=float)
+        if self.compiled is not None:
+            y = self.engine.process_block(y)
+            if self.clip:
+                y = np.clip(y, -1.0, 1.0)
+        return self.all_pass_chain.process_block(y)
+
+
+def roots_to_direct_form(zeros, poles):
+    """Direct form coefficients FilterApp uses: monic polynomials of the roots, unit gain"""
+    b = np.array(np.poly(zeros) if len(zeros) else [1.0], dtype=complex)
+    a = np.array(np.poly(poles) if len(poles) else [1.0], dtype=complex)
+    return b / a[0], a / a[0]
+
+
+def roots_to_sections(zeros, poles):
+    """Second-order sections FilterApp uses for the cascade form, unit gain"""
+    return signal.tf2sos(np.poly(zeros), np.poly(poles), pairing='nearest')
+
+
+def compile_zpk(zeros, poles, gain=1.0, form='direct'):
+    """Compile a zero/pole/gain design (e.g. from Filter) into a CompiledFilter"""
+    zeros = list(zeros)
+    poles = list(poles)
+    key = design_key(zeros, poles, (gain,), form)
+    if form == 'direct':
+        b, a = signal.zpk2tf(zeros, poles, gain)
+        coeffs = {'b': np.atleast_1d(b), 'a': np.atleast_1d(a)}
+    else:
+        coeffs = signal.zpk2sos(zeros, poles, gain)
+    return CompiledFilter(key, form, coeffs)
@@ -0,0 +1,128 @@
+import time
+from collections import deque
+
+import numpy as np
+
+
+class MouseCapture:
+    """
+    Timestamped input events resampled to a fixed sample rate.
+
+    Mouse events arrive at whatever rate and jitter the window system
+    delivers them. Each event is stored with its perf_counter timestamp and
+    read() turns everything up to now into samples on a regular grid of
+    1 / sample_rate seconds, interpolating between events and holding the
+    last value while the mouse is idle. The filter therefore sees a
+    fixed-rate stream whatever the event timing.
+
+    Latency is measured from an event's timestamp to the moment the caller
+    reports (record_latency) that its filtered sample came out. Jitter is the
+    spread of the intervals between events.
+
+    Attributes:
+        sample_rate (float): Output samples per second
+        events (deque): (timestamp, value) pairs not yet fully consumed
+        latencies (deque): Recent input-to-output latencies in seconds
+        intervals (deque): Recent intervals between events in seconds
+    """
+    # Longest gap filled in one read(); a stalled timer skips ahead instead
+    max_block_seconds = 1.0
+
+    def __init__(self, sample_rate=200.0, history=512):
+        self.sample_rate = float(sample_rate)
+        self.events = deque()
+        self.latencies = deque(maxlen=history)
+        self.intervals = deque(maxlen=history)
+        self.clear()
+
+    def clear(self):
+        """Forget every event and restart the sample grid at the next event"""
+        self.events.clear()
+        self.start_time = None   # Grid origin, the first event's timestamp
+        self.next_index = 0      # Grid index of the next sample to emit
+        self.last_event_time = None
+        self.newest_read_time = None
+        self.reported_time = -np.inf  # Newest event already returned as newest_read_time
+        self.skipped = 0
+
+    def set_sample_rate(self, sample_rate):
+        """Change the output rate, continuing the grid from the next unread sample"""
+        if self.start_time is not None:
+            self.start_time = self.grid_time(self.next_index)
+            self.next_index = 0
+        self.sample_rate = float(sample_rate)
+
+    def grid_time(self, index):
+        return self.start_time + index / self.sample_rate
+
+    def add(self, value, timestamp=None):
+        """Capture one input value at timestamp (perf_counter seconds, default now)"""
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        if self.last_event_time is not None:
+            self.intervals.append(timestamp - self.last_event_time)
+        self.last_event_time = timestamp
+        if self.start_time is None:
+            self.start_time = timestamp
+        self.events.append((timestamp, float(value)))
+
+    def read(self, now=None):
+        """
+        Return the samples whose grid times have passed, as one block.
+
+        newest_read_time is set to the timestamp of the newest event that
+        contributed to this block, or None if no new event did.
+        """
+        self.newest_read_time = None
+        if self.start_time is None or not self.events:
+            return np.zeros(0)
+        if now is None:
+            now = time.perf_counter()
+
+        last_index = int(np.floor((now - self.start_time) * self.sample_rate))
+        n = last_index - self.next_index + 1
+        if n <= 0:
+            return np.zeros(0)
+        max_n = max(1, int(self.max_block_seconds * self.sample_rate))
+        if n > max_n:
+            self.skipped += n - max_n
+            self.next_index += n - max_n
+            n = max_n
+
+        grid = self.grid_time(self.next_index + np.arange(n))
+        times = np.fromiter((t for t, _ in self.events), dtype=float, count=len(self.events))
+        values = np.fromiter((v for _, v in self.events), dtype=float, count=len(self.events))
+        block = np.interp(grid, times, values)
+        self.next_index += n
+
+        # Newest event reflected in this block, if it was not reported before
+        used = np.flatnonzero(times <= grid[-1])
+        if len(used) and times[used[-1]] > self.reported_time:
+            self.newest_read_time = self.reported_time = times[used[-1]]
+
+        # Keep the last event at or before the grid as the left end of the next interpolation
+        while len(self.events) > 1 and self.events[1][0] <= grid[-1]:
+            self.events.popleft()
+        return block
+
+    def record_latency(self, seconds):
+        """Store an input-to-output latency measured by the caller"""
+        self.latencies.append(seconds)
+
+    def stats(self):
+        """Sample rate, event rate, jitter and latency percentiles (milliseconds)"""
+        intervals = np.asarray(self.intervals)
+        latencies = np.asarray(self.latencies)
+        stats = {
+            'sample_rate': self.sample_rate,
+            'event_rate': float(1.0 / intervals.mean()) if len(intervals) and intervals.mean() > 0 else 0.0,
+            'jitter_ms': float(intervals.std() * 1e3) if len(intervals) else 0.0,
+            'latency_p50_ms': 0.0,
+            'latency_p99_ms': 0.0,
+            'skipped_samples': self.skipped,
+        }
+        if len(latencies):
+            p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+            stats['latency_p50_ms'] = float(p50)
+            stats['latency_p99_ms'] = float(p99)
+        return stats
@@ -0,0 +1,158 @@
+import json
+import threading
+import time
+
+import numpy as np
+
+
+class StageStats:
+    """
+    Rolling latency record for one stage of the processing chain.
+
+    The last window span durations are kept in a fixed ring so percentiles
+    reflect recent behaviour; totals cover everything since the last reset.
+    """
+    def __init__(self, window=1024):
+        self.latencies_ns = np.zeros(window, dtype=np.int64)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.samples = 0
+
+    def add(self, elapsed_ns, samples=0):
+        self.latencies_ns[self.count % len(self.latencies_ns)] = elapsed_ns
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        self.samples += samples
+
+    def summary(self, wall_s):
+        """Latencies in microseconds plus throughput figures"""
+        recent = self.latencies_ns[:min(self.count, len(self.latencies_ns))]
+        p50, p99 = np.percentile(recent, [50, 99]) / 1e3 if len(recent) else (0.0, 0.0)
+        return {
+            'count': self.count,
+            'p50_us': float(p50),
+            'p99_us': float(p99),
+            'mean_us': self.total_ns / self.count / 1e3 if self.count else 0.0,
+            'max_us': self.max_ns / 1e3,
+            'samples': self.samples,
+            # Samples per second of time spent in the stage, i.e. its capacity
+            'throughput_sps': self.samples / (self.total_ns / 1e9) if self.total_ns else 0.0,
+            # Samples per second of wall time, i.e. the rate actually sustained
+            'rate_sps': self.samples / wall_s if wall_s > 0 else 0.0,
+        }
+
+
+class Span:
+    """Context manager timing one stage with perf_counter_ns"""
+    __slots__ = ('owner', 'stage', 'samples', 'start')
+
+    def __init__(self, owner, stage, samples):
+        self.owner = owner
+        self.stage = stage
+        self.samples = samples
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.owner.record(self.stage, time.perf_counter_ns() - self.start, self.samples)
+        return False
+
+
+class NullSpan:
+    """Span used while instrumentation is off; costs one method call"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Instrumentation:
+    """
+    Opt-in per-stage profiling for the real-time processing chain.
+
+    Stages are timed with span(), e.g.
+
+        with instrumentation.span('filter', len(x)):
+            y = engine.process_block(x)
+
+    and events are tallied with count(). While disabled, span() returns a
+    shared no-op context and count() returns immediately, so the hooks can
+    stay in the hot path. Stages may be recorded from the GUI thread and the
+    DSP worker thread at the same time.
+
+    Attributes:
+        enabled (bool): Whether spans and counters are recorded
+        stages (dict): Stage name -> StageStats
+        counters (dict): Event name -> count (e.g. 'dropped_samples')
+    """
+    def __init__(self, window=1024, enabled=False):
+        self.window = window
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear every stage and counter"""
+        with self.lock:
+            self.stages = {}
+            self.counters = {}
+            self.started = time.perf_counter()
+
+    def span(self, stage, samples=0):
+        """Time a block of code as one occurrence of stage, processing samples"""
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, stage, samples)
+
+    def record(self, stage, elapsed_ns, samples=0):
+        """Add one measured duration to a stage"""
+        if not self.enabled:
+            return
+        stats = self.stages.get(stage)
+        if stats is None:
+            with self.lock:
+                stats = self.stages.setdefault(stage, StageStats(self.window))
+        stats.add(elapsed_ns, samples)
+
+    def count(self, name, n=1):
+        """Increase a counter such as dropped_samples or errors"""
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self):
+        """Current statistics as a JSON-serialisable dict"""
+        wall_s = time.perf_counter() - self.started
+        with self.lock:
+            stages = dict(self.stages)
+            counters = dict(self.counters)
+        return {
+            'elapsed_s': wall_s,
+            'stages': {name: stats.summary(wall_s) for name, stats in stages.items()},
+            'counters': counters,
+        }
+
+    def export_json(self, filename):
+        """Write snapshot() to a JSON file"""
+        with open(filename, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+    def summary_text(self):
+        """Compact multi-line summary for an on-screen overlay"""
+        snapshot = self.snapshot()
+        lines = [f"{'stage':<12}{'p50 us':>9}{'p99 us':>9}{'kS/s':>9}"]
+        for name, stats in snapshot['stages'].items():
+            lines.append(f"{name:<12}{stats['p50_us']:>9.1f}{stats['p99_us']:>9.1f}"
+                         f"{stats['rate_sps'] / 1e3:>9.2f}")
+        for name, value in snapshot['counters'].items():
+            lines.append(f"{name}: {value}")
+        return "\n".join(lines)
@@ -0,0 +1,271 @@
+import csv
+import itertools
+import os
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Samples per chunk when streaming files through a filter
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class CSVSignalReader:
+    """
+    Streams a CSV table in chunks of rows.
+
+    A non-numeric first row is treated as a header. Only the signal column is
+    filtered (the last column by default, e.g. 'Signal' in test_signal.csv);
+    other columns such as 'Time' are passed through unchanged. Blank lines are
+    skipped; a row with a different number of columns than the first, or a
+    non-numeric value, raises ValueError naming its line.
+    """
+    def __init__(self, path, column=None):
+        self.path = Path(path)
+        self.file = open(self.path, 'r', newline='')
+        self.reader = csv.reader(self.file)
+        first = next(self.non_blank_rows(), None)
+        if first is None:
+            self.file.close()
+            raise ValueError(f"{self.path} is empty")
+        self.first_line = self.reader.line_num
+
+        try:
+            self.first_row = [float(v) for v in first]
+            self.header = None
+        except ValueError:
+            self.first_row = None
+            self.header = first
+
+        self.n_columns = n_columns = len(first)
+        if column is None:
+            self.columns = [n_columns - 1]
+        elif isinstance(column, str):
+            if self.header is None or column not in self.header:
+                raise ValueError(f"Column '{column}' not found in {self.path}")
+            self.columns = [self.header.index(column)]
+        else:
+            self.columns = [int(column)]
+        self.sample_rate = None
+
+    def non_blank_rows(self):
+        """Rows of the CSV file, skipping blank lines such as a second trailing newline"""
+        for row in self.reader:
+            if any(v.strip() for v in row):
+                yield row
+
+    def rows(self):
+        """(line number, row) pairs of the data rows, checked against the first row's width"""
+        if self.first_row is not None:
+            yield self.first_line, self.first_row
+        for row in self.non_blank_rows():
+            if len(row) != self.n_columns:
+                raise ValueError(f"{self.path}, line {self.reader.line_num}: expected "
+                                 f"{self.n_columns} columns, found {len(row)}")
+            yield self.reader.line_num, row
+
+    def chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield (n_rows, n_columns) float arrays"""
+        rows = self.rows()
+        while True:
+            block = list(itertools.islice(rows, chunk_size))
+            if not block:
+                return
+            try:
+                yield np.array([row for _, row in block], dtype=float).reshape(len(block), -1)
+            except ValueError:
+                for line, row in block:
+                    try:
+                        [float(v) for v in row]
+                    except ValueError:
+                        raise ValueError(f"{self.path}, line {line}: non-numeric value in {row}") from None
+                raise
+
+    def close(self):
+        self.file.close()
+
+
+class CSVSignalWriter:
+    """Writes filtered chunks with the same columns (and header) as the input"""
+    def __init__(self, path, reader):
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        if reader.header is not None:
+            self.writer.writerow(reader.header)
+
+    def write(self, chunk):
+        self.writer.writerows(chunk.tolist())
+
+    def close(self):
+        self.file.close()
+
+
+class NPYSignalReader:
+    """
+    Memory-maps a .npy file so only the chunk being filtered is paged in.
+
+    1-D arrays are one signal; 2-D arrays are (samples, channels) and every
+    channel is filtered.
+    """
+    def __init__(self, path):
+        self.data = np.load(path, mmap_mode='r')
+        if self.data.ndim not in (1, 2):
+            raise ValueError(f"Expected a 1-D or 2-D array, got shape {self.data.shape}")
+        self.columns = list(range(1 if self.data.ndim == 1 else self.data.shape[1]))
+        self.sample_rate = None
+
+    def chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield (n_samples, n_channels) float arrays"""
+        for start in range(0, self.data.shape[0], chunk_size):
+            chunk = np.array(self.data[start:start + chunk_size], dtype=float)
+            yield chunk.reshape(len(chunk), -1)
+
+    def close(self):
+        del self.data
+
+
+class NPYSignalWriter:
+    """Writes into a memory-mapped .npy file with the input's shape"""
+    def __init__(self, path, reader):
+        self.out = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64,
+                                             shape=reader.data.shape)
+        self.position = 0
+
+    def write(self, chunk):
+        target = self.out[self.position:self.position + len(chunk)]
+        target[...] = chunk.reshape(target.shape)
+        self.position += len(chunk)
+
+    def close(self):
+        self.out.flush()
+        del self.out
+
+
+class WAVSignalReader:
+    """Reads PCM WAV frames in chunks through the wave module, scaled to [-1, 1)"""
+    def __init__(self, path):
+        self.file = wave.open(str(path), 'rb')
+        self.n_channels = self.file.getnchannels()
+        self.sample_width = self.file.getsampwidth()
+        self.sample_rate = self.file.getframerate()
+        self.columns = list(range(self.n_channels))
+
+    def chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield (n_frames, n_channels) float arrays"""
+        while True:
+            raw = self.file.readframes(chunk_size)
+            if not raw:
+                return
+            yield pcm_to_float(raw, self.sample_width).reshape(-1, self.n_channels)
+
+    def close(self):
+        self.file.close()
+
+
+class WAVSignalWriter:
+    """Writes PCM WAV with the input's channel count, sample width and rate"""
+    def __init__(self, path, reader):
+        self.sample_width = reader.sample_width
+        self.file = wave.open(str(path), 'wb')
+        self.file.setnchannels(reader.n_channels)
+        self.file.setsampwidth(reader.sample_width)
+        self.file.setframerate(reader.sample_rate)
+
+    def write(self, chunk):
+        self.file.writeframes(float_to_pcm(chunk.ravel(), self.sample_width))
+
+    def close(self):
+        self.file.close()
+
+
+def pcm_to_float(raw, sample_width):
+    """Convert little-endian PCM bytes to float64 samples in [-1, 1)"""
+    if sample_width == 1:
+        return (np.frombuffer(raw, dtype=np.uint8).astype(float) - 128) / 128
+    if sample_width == 3:
+        b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        ints = b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)
+        ints = np.where(ints >= 1 << 23, ints - (1 << 24), ints)
+        return ints / float(1 << 23)
+    if sample_width in (2, 4):
+        ints = np.frombuffer(raw, dtype=f'<i{sample_width}')
+        return ints / float(1 << (8 * sample_width - 1))
+    raise ValueError(f"Unsupported WAV sample width: {sample_width} bytes")
+
+
+def float_to_pcm(samples, sample_width):
+    """Convert float samples to little-endian PCM bytes, clipping to full scale"""
+    scale = 1 << (8 * sample_width - 1)
+    ints = np.clip(np.round(samples * scale), -scale, scale - 1).astype(np.int64)
+    if sample_width == 1:
+        return (ints + 128).astype(np.uint8).tobytes()
+    if sample_width == 3:
+        ints = ints & 0xFFFFFF
+        return np.stack([ints & 0xFF, (ints >> 8) & 0xFF, (ints >> 16) & 0xFF],
+                        axis=1).astype(np.uint8).tobytes()
+    return ints.astype(f'<i{sample_width}').tobytes()
+
+
+READERS = {'.csv': CSVSignalReader, '.npy': NPYSignalReader, '.wav': WAVSignalReader}
+WRITERS = {'.csv': CSVSignalWriter, '.npy': NPYSignalWriter, '.wav': WAVSignalWriter}
+
+
+def open_signal(path, column=None):
+    """Open a CSV, NPY or WAV signal file for chunked reading"""
+    suffix = Path(path).suffix.lower()
+    if suffix not in READERS:
+        raise ValueError(f"Unsupported signal file type: {suffix}")
+    if suffix == '.csv':
+        return CSVSignalReader(path, column)
+    return READERS[suffix](path)
+
+
+def filter_file(in_path, out_path, make_filter, chunk_size=DEFAULT_CHUNK_SIZE, column=None):
+    """
+    Stream a signal file through a filter design and write the result.
+
+    Args:
+        in_path, out_path: Input and output files, same format (.csv, .npy or .wav)
+        make_filter: Callable returning a fresh object with process_block(x),
+            e.g. a DesignFilter; it filters every channel as one
+            (channels, samples) block
+        chunk_size (int): Samples read, filtered and written at a time
+        column: CSV column to filter (name or index, default the last column)
+
+    Returns:
+        int: Number of samples filtered per channel
+
+    The output is written to a temporary file next to out_path and moved
+    into place only once the whole input was filtered, so a malformed input
+    never leaves a truncated or partial out_path behind.
+    """
+    out_path = Path(out_path)
+    out_suffix = out_path.suffix.lower()
+    if out_suffix != Path(in_path).suffix.lower():
+        raise ValueError("Input and output files must have the same format")
+
+    reader = open_signal(in_path, column)
+    try:
+        # Read the first chunk before creating any output, so early errors leave no file
+        chunks = reader.chunks(chunk_size)
+        first = next(chunks, None)
+        part_path = out_path.with_name(f".{out_path.name}.part")
+        writer = WRITERS[out_suffix](part_path, reader)
+        try:
+            filter = make_filter()
+            columns = reader.columns
+            n_samples = 0
+            if first is not None:
+                for chunk in itertools.chain([first], chunks):
+                    chunk[:, columns] = filter.process_block(chunk[:, columns].T).T
+                    writer.write(chunk)
+                    n_samples += len(chunk)
+        except BaseException:
+            writer.close()
+            part_path.unlink(missing_ok=True)
+            raise
+        writer.close()
+        os.replace(part_path, out_path)
+        return n_samples
+    finally:
+        reader.close()
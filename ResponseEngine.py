@@ -0,0 +1,241 @@
+from itertools import zip_longest
+
+import numpy as np
+
+# Converts a natural-log magnitude to decibels
+DB_PER_NEPER = 20 / np.log(10)
+
+# Running products outside this magnitude range are redone in the log domain
+PRODUCT_MIN = 1e-280
+PRODUCT_MAX = 1e280
+
+
+def complex_log(x):
+    """
+    Principal complex log as log|x| + j*angle(x).
+
+    Same values as np.log on complex input, but built from two real
+    functions, which is many times faster than numpy's complex log.
+    """
+    out = np.empty(np.shape(x), dtype=complex)
+    with np.errstate(divide='ignore'):
+        out.real = np.log(np.abs(x))
+    out.imag = np.angle(x)
+    return out
+
+
+def frequency_grid(num_points=2000, endpoint=True):
+    """Frequencies from 0 to pi (inclusive, or excluded like freqz when endpoint=False)"""
+    return np.linspace(0, np.pi, num_points, endpoint=endpoint)
+
+
+def root_log_terms(roots, w):
+    """
+    Complex log of (e^jw - root) for every root, shape (len(roots), len(w)).
+
+    The real part is log|e^jw - root| and the imaginary part its angle, so a
+    response is a sum of rows instead of a product, which cannot overflow or
+    underflow for clustered roots. A log per matrix element costs more than a
+    multiply, so full evaluations use it only as a fallback.
+    """
+    roots = np.asarray(roots, dtype=complex).reshape(-1, 1)
+    return complex_log(np.exp(1j * w) - roots)
+
+
+def log_response(zeros, poles, w, gain=1.0):
+    """Complex log of H(e^jw) = gain * prod(z - zeros) / prod(z - poles)"""
+    with np.errstate(divide='ignore'):
+        log_h = np.full(len(w), np.log(complex(gain)))
+    if len(zeros):
+        log_h += root_log_terms(zeros, w).sum(axis=0)
+    if len(poles):
+        log_h -= root_log_terms(poles, w).sum(axis=0)
+    return log_h
+
+
+def product_log_response(zeros, poles, w, gain=1.0, z=None):
+    """
+    Complex log of H(e^jw) from a running product over the roots.
+
+    Zeros multiply and poles divide in alternation, which keeps the product
+    near unity for typical designs; only the N-point result is logged. If the
+    product still leaves [PRODUCT_MIN, PRODUCT_MAX] (high-order clusters, or a
+    root exactly on the grid) the design is re-evaluated with log_response.
+    z may pass a precomputed e^jw.
+    """
+    if z is None:
+        z = np.exp(1j * w)
+    h = np.full(len(w), complex(gain))
+    factor = np.empty_like(h)
+    with np.errstate(over='ignore', under='ignore', divide='ignore', invalid='ignore'):
+        for zero, pole in zip_longest(zeros, poles):
+            if zero is not None:
+                h *= np.subtract(z, zero, out=factor)
+            if pole is not None:
+                h /= np.subtract(z, pole, out=factor)
+        magnitude = np.abs(h)
+    if np.all((magnitude >= PRODUCT_MIN) & (magnitude <= PRODUCT_MAX)):
+        return complex_log(h)
+    return log_response(zeros, poles, w, gain)
+
+
+def fft_log_response(zeros, poles, num_points, gain=1.0, endpoint=True):
+    """
+    Complex log of H(e^jw) from zero-padded FFTs of the b/a polynomials.
+
+    Only valid while both polynomials fit in the FFT length; returns None
+    otherwise so callers can fall back to product_log_response.
+    """
+    b = np.poly(zeros) if len(zeros) else np.array([1.0])
+    a = np.poly(poles) if len(poles) else np.array([1.0])
+    n_fft = 2 * (num_points - 1) if endpoint else 2 * num_points
+    if max(len(b), len(a)) > n_fft:
+        return None
+
+    # np.fft.fft handles complex coefficients from non-realizable designs
+    B = np.fft.fft(b, n_fft)[:num_points]
+    A = np.fft.fft(a, n_fft)[:num_points]
+    with np.errstate(divide='ignore'):
+        log_h = np.log(complex(gain)) + complex_log(B) - complex_log(A)
+
+    # The FFT evaluates B(e^-jw) / A(e^-jw); prod(z - root) is z^len(roots) * B(z^-1)
+    w = frequency_grid(num_points, endpoint)
+    return log_h + 1j * w * (len(zeros) - len(poles))
+
+
+def frequency_response(zeros, poles, gain=1.0, num_points=2000, method='product',
+                       endpoint=True, tf_form=False, floor_db=None):
+    """
+    Evaluate the frequency response of a pole/zero design.
+
+    Args:
+        zeros, poles: Complex roots of the design
+        gain (float): Overall gain factor
+        num_points (int): Resolution of the frequency grid
+        method (str): 'product' (running product over the roots, redone in
+            the log domain only on overflow/underflow), 'fft' (zero-padded FFT
+            of the b/a polynomials, falling back to 'product' for high orders)
+            or 'log' (broadcast sum of log terms, always)
+        endpoint (bool): Include pi in the grid (False matches scipy's freqz)
+        tf_form (bool): Use the phase of the transfer function in powers of
+            z^-1 (as freqz does) rather than of the root-product form
+        floor_db (float): Lowest magnitude returned, None keeps -inf at zeros
+
+    Returns:
+        w (ndarray): Frequencies in rad/sample
+        magnitude_db (ndarray): Magnitude response in dB
+        phase_rad (ndarray): Phase response wrapped to [-pi, pi)
+    """
+    w = frequency_grid(num_points, endpoint)
+
+    log_h = None
+    if method == 'fft':
+        log_h = fft_log_response(zeros, poles, num_points, gain, endpoint)
+    elif method == 'log':
+        log_h = log_response(zeros, poles, w, gain)
+    if log_h is None:
+        log_h = product_log_response(zeros, poles, w, gain)
+
+    if tf_form:
+        log_h = log_h + 1j * w * (len(poles) - len(zeros))
+
+    magnitude_db, phase_rad = log_to_db_phase(log_h, floor_db)
+    return w, magnitude_db, phase_rad
+
+
+def log_to_db_phase(log_h, floor_db=None):
+    """Split a complex log response into magnitude (dB) and phase wrapped to [-pi, pi)"""
+    magnitude_db = DB_PER_NEPER * log_h.real
+    if floor_db is not None:
+        magnitude_db = np.maximum(magnitude_db, floor_db)
+    phase_rad = (log_h.imag + np.pi) % (2 * np.pi) - np.pi
+    return magnitude_db, phase_rad
+
+
+class IncrementalResponse:
+    """
+    Frequency response kept as the complex log of its root product.
+
+    A full evaluation (new design, added or deleted roots) uses
+    product_log_response. When only a few roots move (a drag moves one root
+    and its conjugate) the summed log is patched instead: the moved root's
+    old factor log(e^jw - old) is subtracted and the new one added, which
+    costs two N-point logs per root instead of re-evaluating every root.
+
+    Attributes:
+        w (ndarray): Frequency grid in rad/sample
+        zeros, poles (ndarray): Roots the cached response was computed for
+        log_roots (ndarray): Complex log of prod(e^jw - zeros) / prod(e^jw - poles)
+    """
+    # Above this many moved roots a full rebuild is as cheap as patching factors
+    max_incremental_moves = 8
+    # Patching a root costs about this many product steps (two logs vs one multiply)
+    patch_cost = 10
+    # Rebuild after this many incremental updates to bound rounding drift
+    resync_interval = 256
+
+    def __init__(self, num_points=2000):
+        self.w = frequency_grid(num_points)
+        self.z = np.exp(1j * self.w)
+        self.set_design([], [])
+
+    def set_design(self, zeros, poles, gain=1.0):
+        """Evaluate the whole response from scratch"""
+        self.zeros = np.asarray(zeros, dtype=complex)
+        self.poles = np.asarray(poles, dtype=complex)
+        self.set_gain(gain)
+        self.resync()
+
+    def set_gain(self, gain):
+        """Replace the overall gain factor"""
+        self.gain = gain
+        with np.errstate(divide='ignore'):
+            self.log_gain = np.log(complex(gain))
+
+    def resync(self):
+        """Re-evaluate the root product for the cached roots"""
+        self.log_roots = product_log_response(self.zeros, self.poles, self.w, z=self.z)
+        self.updates_since_resync = 0
+
+    def update(self, zeros, poles, gain=1.0):
+        """Bring the response up to date with a design, patching only the roots that moved"""
+        zeros = np.asarray(zeros, dtype=complex)
+        poles = np.asarray(poles, dtype=complex)
+        if zeros.shape != self.zeros.shape or poles.shape != self.poles.shape:
+            self.set_design(zeros, poles, gain)
+            return
+
+        moved_zeros = np.flatnonzero(zeros != self.zeros)
+        moved_poles = np.flatnonzero(poles != self.poles)
+        moves = len(moved_zeros) + len(moved_poles)
+        # Small designs are cheaper to re-evaluate than to patch
+        if (moves > self.max_incremental_moves
+                or moves * self.patch_cost > len(zeros) + len(poles)):
+            self.set_design(zeros, poles, gain)
+            return
+
+        patched = all([self.move_root(self.zeros[i], zeros[i], 1) for i in moved_zeros]
+                      + [self.move_root(self.poles[i], poles[i], -1) for i in moved_poles])
+        self.zeros = zeros
+        self.poles = poles
+        if gain != self.gain:
+            self.set_gain(gain)
+
+        if not patched or self.updates_since_resync >= self.resync_interval:
+            self.resync()
+
+    def move_root(self, old_root, new_root, sign):
+        """Divide out one root's old factor and multiply in the new one; False if that is not finite"""
+        old_row = complex_log(self.z - old_root)
+        new_row = complex_log(self.z - new_root)
+        if not (np.isfinite(old_row).all() and np.isfinite(new_row).all()):
+            # A root on the grid gives log(0); the caller re-evaluates instead of subtracting infinities
+            return False
+        self.log_roots += sign * (new_row - old_row)
+        self.updates_since_resync += 1
+        return True
+
+    def response(self, floor_db=None):
+        """Return (w, magnitude_db, phase_rad) for the cached design"""
+        magnitude_db, phase_rad = log_to_db_phase(self.log_gain + self.log_roots, floor_db)
+        return self.w, magnitude_db, phase_rad
@@ -0,0 +1,86 @@
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Preallocated float64 ring buffer for streaming signals.
+
+    Every sample is written twice, at i and i + capacity, so the most recent
+    N samples (N <= capacity) always form one contiguous slice of the storage.
+    latest() therefore returns a view without copying, and reading a display
+    window costs the same regardless of how long the buffer is.
+
+    With channels set, every sample is a frame of that many values: blocks
+    are (channels, samples) and latest() returns (channels, n) views.
+
+    Attributes:
+        capacity (int): Number of samples kept, rounded up to a power of two
+        channels (int): Values per sample, or None for a 1-D signal
+        data (ndarray): Mirrored storage, shape (2 * capacity,) or (channels, 2 * capacity)
+        write_index (int): Total number of samples ever written
+    """
+    def __init__(self, capacity, channels=None):
+        self.capacity = 1 << max(0, int(capacity) - 1).bit_length()
+        self.mask = self.capacity - 1
+        self.channels = channels
+        shape = (2 * self.capacity,) if channels is None else (channels, 2 * self.capacity)
+        self.data = np.zeros(shape)
+        self.write_index = 0
+
+    def __len__(self):
+        return min(self.write_index, self.capacity)
+
+    def __getitem__(self, key):
+        """Index samples (the last axis), oldest first"""
+        return self.latest(len(self))[..., key]
+
+    def append(self, value):
+        """Add one sample (one value per channel)"""
+        pos = self.write_index & self.mask
+        self.data[..., pos] = value
+        self.data[..., pos + self.capacity] = value
+        self.write_index += 1
+
+    def extend(self, samples):
+        """
+        Add a block of samples, (channels, samples) with channels, keeping only the last capacity.
+
+        Returns the number of samples of the block that did not fit and were discarded.
+        """
+        x = np.asarray(samples, dtype=float)
+        x = x.ravel() if self.channels is None else x.reshape(self.channels, -1)
+        n = x.shape[-1]
+        overflow = max(0, n - self.capacity)
+        if overflow:
+            self.write_index += overflow
+            x = x[..., -self.capacity:]
+            n = self.capacity
+
+        start = self.write_index & self.mask
+        first = min(n, self.capacity - start)
+        self.data[..., start:start + first] = x[..., :first]
+        self.data[..., start + self.capacity:start + self.capacity + first] = x[..., :first]
+        rest = n - first
+        if rest:
+            self.data[..., :rest] = x[..., first:]
+            self.data[..., self.capacity:self.capacity + rest] = x[..., first:]
+        self.write_index += n
+        return overflow
+
+    def latest(self, n):
+        """Contiguous read-only view of the last n samples (oldest first), along the last axis"""
+        n = min(int(n), len(self))
+        end = (self.write_index & self.mask) + self.capacity
+        view = self.data[..., end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def clear(self):
+        """Drop every sample without reallocating"""
+        self.write_index = 0
+
+    def resized(self, capacity):
+        """Return a new buffer of the given capacity holding the most recent samples"""
+        buffer = RingBuffer(capacity, self.channels)
+        buffer.extend(self.latest(min(len(self), buffer.capacity)))
+        return buffer
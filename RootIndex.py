@@ -0,0 +1,113 @@
+import math
+
+
+class RootIndex:
+    """
+    Uniform grid hash over the positions of zeros or poles.
+
+    Each root is filed under the cell_size x cell_size cell containing it, so
+    finding the roots near a click only looks at the few cells around it
+    instead of scanning every root. The index mirrors one list of roots
+    (source) and is updated in place as roots are added, moved or deleted
+    (deletes swap the last root into the freed slot); sync() rebuilds it when
+    the list was replaced wholesale (undo, load, presets).
+
+    Attributes:
+        cell_size (float): Cell width in data units
+        source (list): The root list the index was built from
+        positions (list): Indexed position of every root
+        cells (dict): (cell_x, cell_y) -> set of root indices
+    """
+    def __init__(self, cell_size=0.1):
+        self.cell_size = cell_size
+        self.rebuild([])
+
+    def __len__(self):
+        return len(self.positions)
+
+    def rebuild(self, points):
+        """Index every root in points from scratch"""
+        self.source = points
+        self.positions = []
+        self.cells = {}
+        for point in points:
+            self.insert(point)
+
+    def sync(self, points):
+        """Rebuild if points is not the list being mirrored"""
+        if points is not self.source or len(points) != len(self.positions):
+            self.rebuild(points)
+
+    def cell(self, point):
+        return (math.floor(point.real / self.cell_size), math.floor(point.imag / self.cell_size))
+
+    def insert(self, point):
+        """Index a root appended to the end of the list"""
+        point = complex(point)
+        self.cells.setdefault(self.cell(point), set()).add(len(self.positions))
+        self.positions.append(point)
+
+    def move(self, i, point):
+        """Update the position of root i"""
+        point = complex(point)
+        old_cell = self.cell(self.positions[i])
+        new_cell = self.cell(point)
+        if new_cell != old_cell:
+            self.discard(old_cell, i)
+            self.cells.setdefault(new_cell, set()).add(i)
+        self.positions[i] = point
+
+    def remove(self, i):
+        """
+        Drop root i by moving the last root into its slot (swap-remove).
+
+        Only the moved root is re-filed, so a delete costs the same however
+        many roots there are. The caller must make the same swap in the root
+        list. Returns the old index of the moved root, or None if i was last.
+        """
+        last = len(self.positions) - 1
+        self.discard(self.cell(self.positions[i]), i)
+        moved = self.positions.pop()
+        if i == last:
+            return None
+        members = self.cells[self.cell(moved)]
+        members.discard(last)
+        members.add(i)
+        self.positions[i] = moved
+        return last
+
+    def discard(self, cell, i):
+        members = self.cells[cell]
+        members.discard(i)
+        if not members:
+            del self.cells[cell]
+
+    def nearest(self, x, y, radius, scale=(1.0, 1.0), exclude=None):
+        """
+        Index of the root closest to (x, y) within radius, or None.
+
+        Distances are measured after multiplying data offsets by scale (e.g.
+        pixels per data unit along x and y), so with a pixel scale and a
+        pixel radius the nearest root on screen wins.
+        """
+        sx, sy = scale
+        rx, ry = radius / sx, radius / sy
+        x0, y0 = self.cell(complex(x - rx, y - ry))
+        x1, y1 = self.cell(complex(x + rx, y + ry))
+
+        # Zoomed far out the search box can span more cells than are occupied
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self.cells):
+            candidates = (i for members in self.cells.values() for i in members)
+        else:
+            candidates = (i for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)
+                          for i in self.cells.get((cx, cy), ()))
+
+        best, best_d2 = None, radius * radius
+        for i in candidates:
+            if i == exclude:
+                continue
+            p = self.positions[i]
+            d2 = ((p.real - x) * sx) ** 2 + ((p.imag - y) * sy) ** 2
+            if d2 <= best_d2:
+                best, best_d2 = i, d2
+        return best
@@ -1,20 +1,137 @@
 import numpy as np
-import pandas as pd
+from scipy import signal as sps
 
-# Parameters
-fs = 500  # Sampling frequency (Hz)
-t = np.linspace(0, 20, 10000)  # Time array with 10000 points
-f1 = 5  # First frequency (Hz)
-f2 = 100  # Second frequency (Hz)
+# Paul Kellet's economy pink noise filter (-3 dB/octave within 0.05 dB above ~9 Hz at 44.1 kHz)
+PINK_B = np.array([0.049922035, -0.095993537, 0.050612699, -0.004408786])
+PINK_A = np.array([1.0, -2.494956002, 2.017265875, -0.522189400])
 
-# Generate the composite signal
-signal = np.sin(2 * np.pi * f1 * t) + 0.5 * np.sin(2 * np.pi * f2 * t)
 
-# Create DataFrame with time and signal columns
-df = pd.DataFrame({
-    'Time': t,
-    'Signal': signal
-})
+class BlockSignalGenerator:
+    """
+    Phase-continuous test signal source producing numpy blocks.
 
-# Save to CSV
-df.to_csv('test_signal.csv', index=False)
\ No newline at end of file
+    Every call to generate(n) continues exactly where the previous block
+    ended: oscillator phases are kept as accumulated cycles, the chirp sweep
+    position and the pink noise filter state are carried over, so a signal
+    generated in blocks equals the same signal generated in one go. All
+    work is vectorized, so blocks of millions of samples are cheap.
+
+    Kinds:
+        'sine'       Sine at frequency
+        'square'     Square wave at frequency
+        'chirp'      Linear sweep from frequency to stop_frequency over
+                     sweep_time seconds, repeating
+        'white'      Uniform white noise in [-amplitude, amplitude)
+        'pink'       1/f noise with the same RMS as the white noise
+        'impulse'    One impulse of height amplitude per period of frequency
+        'dual_tone'  tones (default 5 Hz + 0.5 x 100 Hz, as in test_signal.csv)
+
+    Attributes:
+        kind (str): One of the kinds above
+        sample_rate (float): Samples per second; may be changed between blocks
+        index (int): Number of samples generated so far
+    """
+    def __init__(self, kind='sine', sample_rate=1000.0, frequency=1.0, amplitude=1.0,
+                 stop_frequency=None, sweep_time=1.0, tones=((5.0, 1.0), (100.0, 0.5)),
+                 seed=None):
+        if kind not in ('sine', 'square', 'chirp', 'white', 'pink', 'impulse', 'dual_tone'):
+            raise ValueError(f"Unknown signal kind: {kind}")
+        self.kind = kind
+        self.sample_rate = float(sample_rate)
+        self.frequency = float(frequency)
+        self.amplitude = float(amplitude)
+        self.stop_frequency = float(stop_frequency if stop_frequency is not None else 10 * frequency)
+        self.sweep_time = float(sweep_time)
+        tones = np.asarray(tones, dtype=float).reshape(-1, 2)
+        self.tone_frequencies = tones[:, 0]
+        self.tone_amplitudes = tones[:, 1]
+        self.seed = seed
+
+        # RMS gain of the pink filter; dividing by it (and sqrt(3)) matches the white noise RMS
+        self.pink_gain = np.sqrt(np.sum(sps.lfilter(PINK_B, PINK_A, np.r_[1.0, np.zeros(1 << 16)]) ** 2))
+        self.reset()
+
+    def reset(self):
+        """Restart every oscillator, sweep and noise source"""
+        self.index = 0
+        self.phase = 0.0  # Cycles, kept in [0, 1)
+        self.tone_phases = np.zeros(len(self.tone_frequencies))
+        self.pink_zi = np.zeros(len(PINK_A) - 1)
+        self.rng = np.random.default_rng(self.seed)
+
+    def generate(self, n):
+        """Return the next n samples"""
+        n = int(n)
+        if n <= 0:
+            return np.zeros(0)
+        kind = self.kind
+        if kind in ('sine', 'square', 'impulse'):
+            cycles = self.advance(self.frequency, n)
+            if kind == 'sine':
+                y = np.sin(2 * np.pi * cycles)
+            elif kind == 'square':
+                y = np.where(cycles % 1.0 < 0.5, 1.0, -1.0)
+            else:
+                # An impulse wherever the phase passes a whole cycle
+                step = self.frequency / self.sample_rate
+                y = (np.floor(cycles) != np.floor(cycles - step)).astype(float)
+        elif kind == 'chirp':
+            y = np.sin(2 * np.pi * self.chirp_cycles(n))
+        elif kind == 'dual_tone':
+            y = self.tones(n)
+        elif kind == 'white':
+            y = self.rng.uniform(-1.0, 1.0, n)
+        else:
+            white = self.rng.standard_normal(n)
+            pink, self.pink_zi = sps.lfilter(PINK_B, PINK_A, white, zi=self.pink_zi)
+            y = pink / (self.pink_gain * np.sqrt(3))
+        self.index += n
+        return self.amplitude * y
+
+    def advance(self, frequency, n):
+        """Phase in cycles of the next n samples, moving the accumulator past them"""
+        step = frequency / self.sample_rate
+        cycles = self.phase + step * np.arange(n)
+        self.phase = (self.phase + step * n) % 1.0
+        return cycles
+
+    def chirp_cycles(self, n):
+        """Phase of the repeating linear sweep, integrated sample by sample"""
+        # Sweep position counted in whole samples so block boundaries cannot shift it
+        sweep_samples = max(1, int(round(self.sweep_time * self.sample_rate)))
+        position = (self.index + np.arange(n)) % sweep_samples
+        f = self.frequency + (self.stop_frequency - self.frequency) * position / sweep_samples
+        # Exclusive running sum of per-sample phase increments
+        increments = f / self.sample_rate
+        cycles = self.phase + np.concatenate(([0.0], np.cumsum(increments[:-1])))
+        self.phase = (cycles[-1] + increments[-1]) % 1.0
+        return cycles
+
+    def tones(self, n):
+        """Weighted sum of sines, each with its own phase accumulator"""
+        steps = self.tone_frequencies / self.sample_rate
+        cycles = self.tone_phases[:, None] + steps[:, None] * np.arange(n)
+        self.tone_phases = (self.tone_phases + steps * n) % 1.0
+        return self.tone_amplitudes @ np.sin(2 * np.pi * cycles)
+
+
+if __name__ == '__main__':
+    import pandas as pd
+
+    # Parameters
+    fs = 500  # Sampling frequency (Hz)
+    t = np.linspace(0, 20, 10000)  # Time array with 10000 points
+    f1 = 5  # First frequency (Hz)
+    f2 = 100  # Second frequency (Hz)
+
+    # Generate the composite signal
+    signal = np.sin(2 * np.pi * f1 * t) + 0.5 * np.sin(2 * np.pi * f2 * t)
+
+    # Create DataFrame with time and signal columns
+    df = pd.DataFrame({
+        'Time': t,
+        'Signal': signal
+    })
+
+    # Save to CSV
+    df.to_csv('test_signal.csv', index=False)
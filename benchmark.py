@@ -0,0 +1,184 @@
+"""
+Headless benchmarks for the DSP hot paths.
+
+Usage:
+    python benchmark.py                          # full sweep, printed as a table
+    python benchmark.py --quick                  # small sweep for a fast check
+    python benchmark.py --save baseline.json     # store results as a baseline
+    python benchmark.py --compare baseline.json  # show speedups against a baseline
+
+Covers block filtering (direct, cascade and the app's all-pass chain), the
+response computation behind each plot redraw (without the matplotlib update)
+and Filter's frequency and impulse responses, swept over filter order, block
+size and channel count. Filtering is reported in samples/sec (summed over
+channels); responses are reported as the latency of one call. Only numpy,
+scipy and the Qt-free modules are imported.
+"""
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from Filter import Filter
+from FilterEngine import AllPassLibrary, DesignFilter, compile_zpk
+from ResponseEngine import IncrementalResponse, frequency_response
+
+ORDERS = [2, 4, 8, 16, 32, 64]
+BLOCK_SIZES = [64, 1024, 16384]
+CHANNELS = [1, 2, 8]
+QUICK = {'orders': [2, 16, 64], 'block_sizes': [1024], 'channels': [1, 8]}
+
+
+def make_design(order, seed=0):
+    """Stable random design with order zeros and poles in conjugate pairs"""
+    rng = np.random.default_rng(seed)
+    half = max(order // 2, 1)
+    zeros = rng.uniform(0.5, 1.0, half) * np.exp(1j * rng.uniform(0, np.pi, half))
+    poles = rng.uniform(0.3, 0.95, half) * np.exp(1j * rng.uniform(0, np.pi, half))
+    return (list(zeros) + list(zeros.conj()))[:order], (list(poles) + list(poles.conj()))[:order]
+
+
+def time_call(fn, min_time=0.2):
+    """Best time of one call, repeating fn until min_time has passed"""
+    fn()  # Warm caches and lazy allocations
+    best = float('inf')
+    total = 0.0
+    calls = 0
+    while total < min_time or calls < 3:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        calls += 1
+    return best
+
+
+def bench_filtering(order, block_size, channels, min_time):
+    """samples/sec of the block engine for one configuration"""
+    zeros, poles = make_design(order)
+    x = np.random.default_rng(1).standard_normal((channels, block_size))
+    # order all-pass stages added and compiled the way the app's all-pass list does it
+    library = AllPassLibrary()
+    first = len(library.filters)
+    for a in np.linspace(0.1, 0.9, order):
+        library.add_filter(a)
+    paths = {
+        'direct': DesignFilter(compile_zpk(zeros, poles, form='direct')),
+        'cascade': DesignFilter(compile_zpk(zeros, poles, form='cascade')),
+        'all_pass': DesignFilter(None, library.compile(range(first, first + order))),
+    }
+    results = {}
+    for name, design in paths.items():
+        elapsed = time_call(lambda: design.process_block(x), min_time)
+        results[name] = channels * block_size / elapsed
+    return results
+
+
+def bench_responses(order, min_time):
+    """Latency in seconds of the response computations for one filter order"""
+    zeros, poles = make_design(order)
+    design = Filter()
+    design.zeros = list(zeros)
+    design.poles = list(poles)
+
+    # Dragging a zero: one root and its conjugate move per redraw; only the
+    # response is timed, not drawing it
+    model = IncrementalResponse(2000)
+    model.set_design(zeros, poles)
+    moved = np.array(zeros)
+    step = [0]
+
+    def drag_response():
+        step[0] += 1
+        moved[0] = zeros[0] * (1 + 1e-3 * (step[0] % 7))
+        if len(moved) > 1:
+            moved[-1] = np.conj(moved[0])
+        model.update(moved, poles)
+        model.response()
+
+    return {
+        'response_incremental': time_call(drag_response, min_time),
+        'response_full': time_call(lambda: frequency_response(zeros, poles, num_points=2000), min_time),
+        'get_frequency_response': time_call(design.get_frequency_response, min_time),
+        'get_impulse_response': time_call(design.get_impulse_response, min_time),
+    }
+
+
+def run(orders, block_sizes, channels, min_time):
+    results = {'filtering': [], 'responses': []}
+    for order in orders:
+        for block_size in block_sizes:
+            for n_channels in channels:
+                rates = bench_filtering(order, block_size, n_channels, min_time)
+                results['filtering'].append(dict(order=order, block_size=block_size,
+                                                 channels=n_channels, **rates))
+        results['responses'].append(dict(order=order, **bench_responses(order, min_time)))
+    return results
+
+
+def result_key(row):
+    return (row['order'], row.get('block_size'), row.get('channels'))
+
+
+def print_results(results, baseline=None):
+    """Print both tables, with the speedup over baseline when one is given"""
+    base = {}
+    if baseline is not None:
+        for table in ('filtering', 'responses'):
+            base[table] = {result_key(row): row for row in baseline.get(table, [])}
+
+    def cell(table, row, name, higher_is_better):
+        value = row[name]
+        text = f"{value / 1e6:9.2f}" if higher_is_better else f"{value * 1e3:9.3f}"
+        ref = base.get(table, {}).get(result_key(row), {}).get(name)
+        if ref:
+            ratio = value / ref if higher_is_better else ref / value
+            text += f" ({ratio:4.2f}x)"
+        return text
+
+    print("Block filtering, Msamples/sec")
+    print(f"{'order':>5} {'block':>6} {'ch':>3} {'direct':>9} {'cascade':>9} {'all_pass':>9}")
+    for row in results['filtering']:
+        cells = " ".join(cell('filtering', row, name, True)
+                         for name in ('direct', 'cascade', 'all_pass'))
+        print(f"{row['order']:>5} {row['block_size']:>6} {row['channels']:>3} {cells}")
+
+    names = ('response_incremental', 'response_full', 'get_frequency_response', 'get_impulse_response')
+    print("\nResponse latency, ms")
+    print(f"{'order':>5} " + " ".join(f"{name:>22}" for name in names))
+    for row in results['responses']:
+        cells = " ".join(f"{cell('responses', row, name, False):>22}" for name in names)
+        print(f"{row['order']:>5} {cells}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the DSP hot paths")
+    parser.add_argument("--quick", action="store_true", help="Run a reduced sweep")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Seconds spent timing each measurement")
+    parser.add_argument("--save", help="Write the results to a JSON baseline")
+    parser.add_argument("--compare", help="Show speedups against a saved JSON baseline")
+    args = parser.parse_args(argv)
+
+    sweep = QUICK if args.quick else {'orders': ORDERS, 'block_sizes': BLOCK_SIZES,
+                                      'channels': CHANNELS}
+    results = run(sweep['orders'], sweep['block_sizes'], sweep['channels'], args.min_time)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved results to {args.save}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
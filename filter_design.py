@@ -0,0 +1,104 @@
+"""
+Headless command-line filtering built on Filter.
+
+Usage:
+    python -m filter_design apply design.json in.npy out.npy [--form cascade]
+    python -m filter_design batch design.json out_dir a.wav b.wav ... [--jobs 8]
+
+The design is a JSON file written by Filter.save_to_file or FilterApp's
+"Save Filter" (.flt); designs without a stored gain are used at unit gain,
+as in the app. Input is streamed through the filter in chunks and
+written in the same format (.csv, .npy or .wav). Only numpy and scipy are
+imported, so this runs on machines without a display or PyQt5.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from BatchFilter import filter_files
+from Filter import Filter
+from FilterEngine import DesignFilter, compile_zpk
+from OfflineFilter import DEFAULT_CHUNK_SIZE, filter_file
+
+
+def load_design(path, form='direct'):
+    """
+    Build a CompiledFilter from a saved design file.
+
+    Uses the zeros, poles and gain stored in the file (gain 1.0 when there is
+    none, as in FilterApp's .flt files), so the result matches what the app
+    filters with. The file is read without notify_subscribers(), which would
+    renormalize the gain to unity at DC.
+    """
+    design = Filter()
+    design.read_file(path)
+    return compile_zpk(design.zeros + design.all_pass_zeros,
+                       design.poles + design.all_pass_poles,
+                       design.gain, form)
+
+
+def apply_command(args):
+    compiled = load_design(args.design, args.form)
+    n_samples = filter_file(args.input, args.output, lambda: DesignFilter(compiled),
+                            chunk_size=args.chunk_size, column=args.column)
+    print(f"Filtered {n_samples} samples: {args.input} -> {args.output}")
+    return 0
+
+
+def batch_command(args):
+    compiled = load_design(args.design, args.form)
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_paths = [out_dir / Path(path).name for path in args.inputs]
+    counts = filter_files(args.inputs, out_paths, compiled, workers=args.jobs,
+                          chunk_size=args.chunk_size, column=args.column)
+    print(f"Filtered {len(counts)} files ({sum(counts)} samples) into {out_dir}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="filter_design",
+                                     description="Apply saved filter designs to signal files")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    apply = commands.add_parser("apply", help="Filter a signal file with a saved design")
+    apply.add_argument("design", help="Design file (.json/.flt)")
+    apply.add_argument("input", help="Input signal (.csv, .npy or .wav)")
+    apply.add_argument("output", help="Output file, same format as the input")
+    apply.add_argument("--form", choices=["direct", "cascade"], default="direct",
+                       help="Realization used for filtering (default: direct)")
+    apply.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                       help="Samples filtered per chunk")
+    apply.add_argument("--column", default=None,
+                       help="CSV column to filter (name or index, default: last column)")
+    apply.set_defaults(func=apply_command)
+
+    batch = commands.add_parser("batch", help="Filter many signal files in parallel")
+    batch.add_argument("design", help="Design file (.json/.flt)")
+    batch.add_argument("out_dir", help="Directory for the filtered files (same names as the inputs)")
+    batch.add_argument("inputs", nargs="+", help="Input signals (.csv, .npy or .wav)")
+    batch.add_argument("--form", choices=["direct", "cascade"], default="direct",
+                       help="Realization used for filtering (default: direct)")
+    batch.add_argument("--jobs", type=int, default=None,
+                       help="Worker processes (default: one per CPU core)")
+    batch.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                       help="Samples filtered per chunk")
+    batch.add_argument("--column", default=None,
+                       help="CSV column to filter (name or index, default: last column)")
+    batch.set_defaults(func=batch_command)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.column is not None and args.column.isdigit():
+        args.column = int(args.column)
+    try:
+        return args.func(args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
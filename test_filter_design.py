@@ -0,0 +1,76 @@
+import json
+
+import numpy as np
+import pytest
+
+import filter_design
+from FilterEngine import (AllPassChain, CompiledFilter, DesignFilter, design_key,
+                          roots_to_direct_form, roots_to_sections)
+from OfflineFilter import filter_file
+
+ZEROS = [-1.0, -1.0]
+POLES = [0.5 + 0.5j, 0.5 - 0.5j]
+
+
+def save_app_design(path, zeros, poles):
+    """Write a design the way FilterApp.save_filter does (zeros and poles only)"""
+    data = {
+        'zeros': [[complex(z).real, complex(z).imag] for z in zeros],
+        'poles': [[complex(p).real, complex(p).imag] for p in poles]
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def app_compiled_filter(zeros, poles, form):
+    """The CompiledFilter FilterApp.get_compiled_filter builds for a loaded design"""
+    if form == 'direct':
+        b, a = roots_to_direct_form(zeros, poles)
+        coeffs = {'b': np.asarray(b), 'a': np.asarray(a)}
+    else:
+        coeffs = np.asarray(roots_to_sections(zeros, poles), dtype=float)
+    return CompiledFilter(design_key(zeros, poles, (), form), form, coeffs)
+
+
+def read_csv(path):
+    return np.loadtxt(path, delimiter=',', skiprows=1)
+
+
+@pytest.fixture
+def signal_csv(tmp_path):
+    t = np.arange(2000) / 500
+    path = tmp_path / 'signal.csv'
+    np.savetxt(path, np.column_stack([t, np.sin(2 * np.pi * 5 * t) + 0.5 * np.sin(2 * np.pi * 100 * t)]),
+               delimiter=',', header='Time,Signal', comments='')
+    return path
+
+
+@pytest.mark.parametrize('form', ['direct', 'cascade'])
+def test_cli_matches_app_offline_output(tmp_path, signal_csv, form):
+    design = tmp_path / 'design.flt'
+    save_app_design(design, ZEROS, POLES)
+
+    cli_out = tmp_path / 'cli.csv'
+    assert filter_design.main(['apply', str(design), str(signal_csv), str(cli_out), '--form', form]) == 0
+
+    # FilterApp's "Filter File" action: DesignFilter over the compiled design and enabled all-pass chain
+    app_out = tmp_path / 'app.csv'
+    compiled = app_compiled_filter(ZEROS, POLES, form)
+    filter_file(signal_csv, app_out, lambda: DesignFilter(compiled, AllPassChain()))
+
+    np.testing.assert_allclose(read_csv(cli_out), read_csv(app_out), rtol=0, atol=1e-9)
+
+
+def test_stored_gain_is_applied(tmp_path, signal_csv):
+    unit = tmp_path / 'unit.json'
+    scaled = tmp_path / 'scaled.json'
+    save_app_design(unit, ZEROS, POLES)
+    with open(unit) as f:
+        data = json.load(f)
+    data['gain'] = 0.125
+    with open(scaled, 'w') as f:
+        json.dump(data, f)
+
+    b_unit = filter_design.load_design(unit).coeffs['b']
+    b_scaled = filter_design.load_design(scaled).coeffs['b']
+    np.testing.assert_allclose(b_scaled, 0.125 * b_unit)